@@ -11,12 +11,6 @@ import shutil
 import logging
 from pathlib import Path
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
-
 def check_dependencies():
     """필수 의존성 확인 및 설치"""
     dependencies = ['setuptools', 'wheel', 'cython', 'numpy']
@@ -242,6 +236,12 @@ def log_performance_status():
 
 def main():
     """메인 빌드 프로세스"""
+    # 로깅 설정 (스크립트로 직접 실행될 때만 적용 - import 시 호출측 로깅 설정 유지)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
     logging.info("🚀 07_Python_DB_Refactoring Cython 빌드 시작")
     
     # 1. 의존성 확인
@@ -27,21 +27,74 @@ except ImportError as e:
     logging.warning(f"⚠ Cython 코드 생성 모듈 로드 실패, Python 폴백 사용: {e}")
 
 # Cython 최적화 함수들을 필요할 때 동적으로 import (안전한 방식)
-def safe_import_cython_function(module_name, function_name):
-    """Cython 함수를 안전하게 import하는 헬퍼 함수"""
+# 실제 사용되는 Cython 함수들만 캐시 (import 실패 결과(None)도 캐시)
+_cython_function_cache = {}
+
+def safe_import_cython_function(module_name, function_name, package_prefix='cython_extensions.'):
+    """Cython 함수를 안전하게 import하는 헬퍼 함수 (결과 캐시)
+
+    package_prefix: 모듈 이름 앞에 붙일 패키지 경로 (최상위 모듈이면 빈 문자열)
+    """
+    cache_key = (package_prefix, module_name, function_name)
+    try:
+        return _cython_function_cache[cache_key]
+    except KeyError:
+        pass
+
+    # 셀/행 단위 호출 경로에서 매번 __import__ (실패 시 sys.path 전체 탐색) 하지 않도록 최초 1회만 시도
     try:
-        # cython_extensions 경로 추가
-        if not module_name.startswith('cython_extensions.'):
-            module_name = f'cython_extensions.{module_name}'
-        module = __import__(module_name, fromlist=[function_name])
-        return getattr(module, function_name)
+        # 패키지 경로 추가 (기본: cython_extensions)
+        full_module_name = module_name
+        if not full_module_name.startswith(package_prefix):
+            full_module_name = f'{package_prefix}{full_module_name}'
+        module = __import__(full_module_name, fromlist=[function_name])
+        func = getattr(module, function_name)
     except (ImportError, AttributeError):
-        return None
+        func = None
 
-# 실제 사용되는 Cython 함수들만 캐시
-_cython_function_cache = {}
+    _cython_function_cache[cache_key] = func
+    return func
+
+# _apply_float_suffix 결과 캐시 (입력 문자열에만 의존하는 순수 변환이므로 시트 간 공유)
+# 같은 상수/값 문자열이 많은 행·시트에서 반복되므로 재계산을 생략
+_float_suffix_cache: Dict[str, str] = {}
+_FLOAT_SUFFIX_CACHE_LIMIT = 100000
+
+# calculatePad 결과 캐시 (정수 인자와 고정된 Info.TabSize에만 의존하므로 시트 간 공유)
+_pad_cache: Dict[tuple, int] = {}
+
+# 행마다 검사하는 EMkMode 그룹 (호출마다 리스트/or 체인을 만들지 않도록 모듈 상수로 한 번만 생성)
+_TITLE_MODES = frozenset((EMkMode.TITLE, EMkMode.TITLE_S, EMkMode.TITLE_H))
+# 프라그마 종료 위치 탐색 시 건너뛰는 모드 (설명/소제목/프로젝트 정의/타이틀)
+_PRAGMA_SKIP_MODES = _TITLE_MODES | {EMkMode.DESCRIPT, EMkMode.SUBTITLE, EMkMode.PRJT_DEF}
+# 정렬 그룹(alignCnt)을 새로 시작하는 모드
+_ALIGN_BREAK_MODES = _TITLE_MODES | {EMkMode.SUBTITLE, EMkMode.DESCRIPT, EMkMode.STR_DEF,
+                                     EMkMode.ENUM_END, EMkMode.NONE, EMkMode.PRJT_DEF}
 
 class CalList:
+    # 자주 사용하는 정규식 패턴 미리 컴파일 - 성능 최적화
+    # (클래스 속성으로 공유: 시트마다 생성되는 인스턴스에서 재컴파일하지 않음)
+    decimal_pattern = re.compile(r'(\d+\.\d*|\.\d+)(?![fF"\w])')
+    decimal_point_only_pattern = re.compile(r'(\d+\.)(?![fF"\w\d])')
+    integer_pattern = re.compile(r'(?<![.\w])([1-9]\d*)(?![.\w\[\]])')
+    zero_pattern = re.compile(r'(?<![.\w])0(?![.\w\[\]])')
+    block_comment_pattern = re.compile(r'/\*.*?\*/', re.DOTALL)
+    line_comment_pattern = re.compile(r'//.*?(?=\n|$)')
+    string_pattern = re.compile(r'"(?:\\.|[^"\\])*"')
+    array_index_pattern = re.compile(r'\[\s*\d+\s*\](?:\[\s*\d+\s*\])*')
+    cast_pattern = re.compile(r'\(\s*FLOAT32\s*\*\s*\)\s*&\w+\s*\[\s*\d+\s*\]\s*(?:\[\s*\d+\s*\])*', re.IGNORECASE)
+
+    # 배열 값 처리용 추가 정규식 패턴들 - Float Suffix 처리용
+    array_value_pattern = re.compile(r'(,\s*)(-?\d+)(\s*,|\s*\})')
+    array_last_value_pattern = re.compile(r'(,\s*)(-?\d+)(\s*\})')
+
+    # _apply_float_suffix Python 폴백용 단어 분리/숫자 판별 패턴
+    float_suffix_split_pattern = re.compile(r'(\s+|[^\w\.])')
+    float_suffix_number_pattern = re.compile(r'^\d+\.?\d*$')
+
+    # 배열 주석 열이 주석 기호/중괄호/공백만으로 이루어졌는지 판별 (writeArrMem 빈 주석 처리용)
+    empty_comment_pattern = re.compile(r'(?:/\*|\*/|[{\s])*')
+
     def __init__(self, fi, title_list, sht_info):
         self.fi = fi
         self.titleList = title_list
@@ -52,21 +105,6 @@ class CalList:
         # 데이터 캐싱을 위한 변수 추가
         self.cell_cache = {}
 
-        # 자주 사용하는 정규식 패턴 미리 컴파일 - 성능 최적화
-        self.decimal_pattern = re.compile(r'(\d+\.\d*|\.\d+)(?![fF"\w])')
-        self.decimal_point_only_pattern = re.compile(r'(\d+\.)(?![fF"\w\d])')
-        self.integer_pattern = re.compile(r'(?<![.\w])([1-9]\d*)(?![.\w\[\]])')
-        self.zero_pattern = re.compile(r'(?<![.\w])0(?![.\w\[\]])')
-        self.block_comment_pattern = re.compile(r'/\*.*?\*/', re.DOTALL)
-        self.line_comment_pattern = re.compile(r'//.*?(?=\n|$)')
-        self.string_pattern = re.compile(r'"(?:\\.|[^"\\])*"')
-        self.array_index_pattern = re.compile(r'\[\s*\d+\s*\](?:\[\s*\d+\s*\])*')
-        self.cast_pattern = re.compile(r'\(\s*FLOAT32\s*\*\s*\)\s*&\w+\s*\[\s*\d+\s*\]\s*(?:\[\s*\d+\s*\])*', re.IGNORECASE)
-
-        # 배열 값 처리용 추가 정규식 패턴들 - add_float_suffix 최적화용
-        self.array_value_pattern = re.compile(r'(,\s*)(-?\d+)(\s*,|\s*\})')
-        self.array_last_value_pattern = re.compile(r'(,\s*)(-?\d+)(\s*\})')
-
         # 기존 코드 유지
         self.dTempCode = {}
         self.dSrcCode = {}
@@ -81,9 +119,7 @@ class CalList:
         self.dItem["Value"] = CellInfos(0, 0, "")
         self.dItem["Description"] = CellInfos(0, 0, "")
 
-        self.prjtList = []
-        for _ in range(5):
-            self.prjtList.append(SPrjtInfo("", []))
+        self.prjtList = [SPrjtInfo("", []) for _ in range(5)]
 
         self.ArrAlignList = []
 
@@ -120,6 +156,9 @@ class CalList:
         # Float Suffix 패턴 초기화 (04_Python_Migration 방식)
         self.float_suffix_patterns = True  # 간단한 플래그로 사용
 
+        # calculatePad 결과 캐시 (모듈 캐시를 공유하여 시트마다 다시 채우지 않음)
+        self.pad_cache = _pad_cache
+
     def cached_read_cell(self, row, col):
         """셀 데이터 캐싱하여 읽기 - 성능 최적화"""
         cache_key = (row, col)
@@ -160,38 +199,62 @@ class CalList:
 
         return value
 
+    def _row_data(self, row):
+        """한 행의 셀 리스트 조회 (범위 밖이면 빈 튜플)"""
+        sht_data = self.shtData
+        return sht_data[row] if row < len(sht_data) else ()
+
+    @staticmethod
+    def _cell_str(row_data, col):
+        """_row_data로 조회한 행에서 셀 문자열 읽기 (변환 규칙은 Info.ReadCell과 동일)"""
+        cell_value = row_data[col] if col < len(row_data) else None
+        return "" if cell_value is None else str(cell_value).strip()
+
+    def read_row_cells(self, row, cols):
+        """한 행의 여러 셀 읽기 (행 조회는 한 번만 수행)"""
+        row_data = self._row_data(row)
+        cell_str = self._cell_str
+        return [cell_str(row_data, col) for col in cols]
+
     def ChkCalListPos(self):
         """아이템 항목 위치 찾기 - 캐싱 적용"""
         err_flag = False
         item_chk_cnt = 0
-        cell_str = ""
         prjt_title = ""
         prjt_def = ""
         prjt_name = ""
         prjt_desc = ""
 
-        # 셀 데이터 캐싱
-        for row in range(self.itemStartPos.Row, min(len(self.shtData), self.itemStartPos.Row + 20)):
-            for col in range(self.itemStartPos.Col, min(len(self.shtData[0]) if len(self.shtData) > 0 else 0, self.itemStartPos.Col + 10)):
-                self.cached_read_cell(row, col)
+        # 항목 헤더 행 탐색: 행 리스트를 직접 순회하며 정규화(str().strip())한 셀을
+        # dItem에 한 번만 조회 (셀 단위 캐시 경유/사전 캐싱 패스 없이 단일 패스)
+        item_cnt = len(self.dItem)
+        col_end = len(self.shtData[0]) if len(self.shtData) > 0 else 0
+        d_item_get = self.dItem.get
 
-        for row in range(self.itemStartPos.Row, len(self.shtData)):
-            if item_chk_cnt == len(self.dItem):
+        # 탐색 가능한 열이 없으면 (빈 시트/빈 첫 행) 행 순회 자체를 생략
+        scan_rows = range(self.itemStartPos.Row, len(self.shtData)) if col_end > self.itemStartPos.Col else ()
+
+        for row in scan_rows:
+            if item_chk_cnt == item_cnt:
                 break
 
             item_chk_cnt = 0
-            for col in range(self.itemStartPos.Col, len(self.shtData[0]) if len(self.shtData) > 0 else 0):
-                cell_str = self.cached_read_cell(row, col)
+            row_data = self.shtData[row]
+            for col in range(self.itemStartPos.Col, min(col_end, len(row_data))):
+                cell_value = row_data[col]
+                if cell_value is None:
+                    continue
 
-                if cell_str in self.dItem:
-                    self.dItem[cell_str].Col = col
+                item = d_item_get(str(cell_value).strip())
+                if item is not None:
+                    item.Col = col
                     item_chk_cnt += 1
 
-                if item_chk_cnt == len(self.dItem):
-                    break
+                    if item_chk_cnt == item_cnt:
+                        break
 
             if item_chk_cnt > 0:
-                if item_chk_cnt == len(self.dItem):
+                if item_chk_cnt == item_cnt:
                     self.itemStartPos.Row = row + 1
                     for key, i_d in self.dItem.items():
                         i_d.Row = self.itemStartPos.Row
@@ -210,13 +273,7 @@ class CalList:
             self.prjtDefCol = self.PrjtStartPos.Col + Info.PrjtDefCol
             self.prjtNameCol = self.PrjtStartPos.Col + Info.PrjtNameCol
 
-            # 테이블 앞부분 데이터 캐싱
-            for row in range(1, min(self.itemStartPos.Row, 30)):
-                self.cached_read_cell(row, self.PrjtStartPos.Col)
-                self.cached_read_cell(row, self.prjtDefCol)
-                self.cached_read_cell(row, self.prjtNameCol)
-                self.cached_read_cell(row, self.prjtNameCol + 2)
-
+            # 프로젝트 정보 행 탐색 (첫 일치 행에서 즉시 종료하므로 사전 캐싱 패스 없이 필요한 행만 읽음)
             for row in range(1, self.itemStartPos.Row - 1):
                 prjt_title = self.cached_read_cell(row, self.PrjtStartPos.Col)
                 prjt_def = self.cached_read_cell(row, self.prjtDefCol)
@@ -253,8 +310,8 @@ class CalList:
         import time
         from PySide6.QtWidgets import QApplication
 
-        logging.info(f"시트 {self.ShtName} ReadCalList 시작")
-        start_time = time.time()
+        logging.info("시트 %s ReadCalList 시작", self.ShtName)
+        start_time = time.perf_counter()
         self.arrNameCnt = 0
 
         try:
@@ -274,11 +331,18 @@ class CalList:
             else:
                 batch_size = 100   # 소량: 100행씩
 
-            logging.info(f"시트 {self.ShtName}: 배치 크기 {batch_size}로 {total_rows}행 처리 시작")
+            logging.info("시트 %s: 배치 크기 %d로 %d행 처리 시작", self.ShtName, batch_size, total_rows)
 
             # 성능 최적화: 딕셔너리 순회를 한 번만 수행하고 리스트로 저장 (결과 동일, 속도 향상)
             item_list = list(self.dItem.values())
 
+            # 행마다 호출되는 메서드는 루프 밖에서 한 번만 바인딩
+            chk_op_code = self.chk_op_code
+            read_arr_mem = self.readArrMem
+            read_row = self.readRow
+            chk_cal_list = self.chkCalList
+            save_temp_list = self.saveTempList
+
             # 배치 단위로 처리
             for batch_start in range(self.itemStartPos.Row, len(self.shtData), batch_size):
                 batch_end = min(batch_start + batch_size, len(self.shtData))
@@ -290,7 +354,7 @@ class CalList:
                     progress = int((processed_rows / total_rows) * 100)
                     try:
                         # 더 상세한 정보 제공
-                        elapsed = time.time() - start_time
+                        elapsed = time.perf_counter() - start_time
                         progress_callback(progress, f"시트 {self.ShtName}: {processed_rows}/{total_rows} 행 처리 중 ({elapsed:.1f}초 경과)")
                     except InterruptedError as e:
                         # 사용자가 취소한 경우
@@ -298,44 +362,30 @@ class CalList:
                         raise  # 예외를 상위로 전파
 
                 # 타임아웃 체크 (10분 제한)
-                elapsed_time = time.time() - start_time
+                elapsed_time = time.perf_counter() - start_time
                 if elapsed_time > 600:  # 10분
                     logging.warning(f"시트 {self.ShtName} 처리 타임아웃: {elapsed_time:.1f}초 경과")
                     raise TimeoutError(f"시트 {self.ShtName} 처리가 10분을 초과했습니다. {processed_rows}/{total_rows} 행 처리 완료")
 
-                # 배치 내 행들 처리 - Cython 최적화 활성화
-                # Cython 최적화 버전 사용 (안전한 동적 import)
-                fast_read_cal_list_processing = safe_import_cython_function('code_generator_v2', 'fast_read_cal_list_processing')
-                if fast_read_cal_list_processing:
-                    try:
-                        processed_rows_batch = fast_read_cal_list_processing(
-                            self.shtData, batch_start, batch_end, item_list
-                        )
-                        # ReadCalList Cython 최적화 사용 (로그 제거)
-                    except Exception:
-                        # Python 폴백
-                        processed_rows_batch = []
-                else:
-                    # Python 폴백
-                    processed_rows_batch = []
-
-                # 개별 행 처리 (Cython 결과 또는 Python 폴백)
+                # 개별 행 처리
+                # (fast_read_cal_list_processing 사전 배치 처리는 결과가 사용되지 않아 생략)
                 for row in range(batch_start, batch_end):
                     try:
                         # 아이템 행 설정 (성능 최적화: 사전 변환된 리스트 사용)
                         for item in item_list:
                             item.Row = row
 
-                        self.chk_op_code()
+                        chk_op_code()
 
-                        if self.mkMode != EMkMode.NONE:
-                            if self.mkMode == EMkMode.ARR_MEM:
-                                self.readArrMem(row)
+                        mk_mode = self.mkMode
+                        if mk_mode != EMkMode.NONE:
+                            if mk_mode == EMkMode.ARR_MEM:
+                                read_arr_mem(row)
                             else:
-                                self.readRow(row)
+                                read_row(row)
 
-                            self.chkCalList(row)
-                            self.saveTempList(row)
+                            chk_cal_list(row)
+                            save_temp_list(row)
 
                     except IndexError as e:
                         logging.error(f"행 {row} 처리 중 인덱스 오류: {e}")
@@ -348,7 +398,7 @@ class CalList:
                 if batch_size >= 500 and processed_rows % (batch_size * 10) == 0:
                     import gc
                     gc.collect()
-                    logging.debug(f"시트 {self.ShtName}: {processed_rows}행 처리 완료, 메모리 정리 실행")
+                    logging.debug("시트 %s: %d행 처리 완료, 메모리 정리 실행", self.ShtName, processed_rows)
 
             self.arrNameCnt = 0
 
@@ -357,7 +407,7 @@ class CalList:
             processed_items = 0
 
             for key, item in self.dTempCode.items():
-                logging.debug(f"아이템 {key} 코드 생성 중, 항목 수: {len(item)}")
+                logging.debug("아이템 %s 코드 생성 중, 항목 수: %d", key, len(item))
 
                 for i in range(len(item)):
                     # 배치 단위로 UI 응답성 유지
@@ -368,7 +418,7 @@ class CalList:
                             progress = int((processed_items / total_items) * 100)
                             try:
                                 # 더 상세한 정보 제공
-                                elapsed = time.time() - start_time
+                                elapsed = time.perf_counter() - start_time
                                 progress_callback(progress, f"시트 {self.ShtName}: 코드 생성 중 {processed_items}/{total_items} ({elapsed:.1f}초 경과)")
                             except InterruptedError as e:
                                 # 사용자가 취소한 경우
@@ -389,53 +439,66 @@ class CalList:
             logging.error(traceback.format_exc())
             raise
 
-        logging.info(f"시트 {self.ShtName} ReadCalList 완료 (소요시간: {time.time() - start_time:.1f}초)")
+        logging.info("시트 %s ReadCalList 완료 (소요시간: %.1f초)", self.ShtName, time.perf_counter() - start_time)
 
     def chk_op_code(self):
         """OpCode 오류 체크 - 성능 최적화"""
-        op_code_row = self.dItem["OpCode"].Row
-        op_code_col = self.dItem["OpCode"].Col
+        op_code_item = self.dItem["OpCode"]
+        op_code_row = op_code_item.Row
+        op_code_col = op_code_item.Col
+
+        # 셀에서 OpCode 문자열 읽기
+        # (OpCode 셀은 행마다 정확히 한 번만 읽히므로 셀 캐시를 거치지 않고 직접 읽음)
+        op_code_str = self._cell_str(self._row_data(op_code_row), op_code_col)
+        op_code_item.Str = op_code_str
 
-        # 셀에서 OpCode 문자열 읽기 (캐싱 적용)
-        op_code_str = self.cached_read_cell(op_code_row, op_code_col)
-        self.dItem["OpCode"].Str = op_code_str
+        # 대부분의 행은 OpCode 셀이 비어 있으므로 딕셔너리 조회/오류 검사 없이 바로 NONE 처리
+        if not op_code_str:
+            self.mkMode = EMkMode.NONE
+            self.mkModeOld = EMkMode.NONE
+            return
 
-        # 유효한 OpCode인지 딕셔너리로 한번에 확인
-        if op_code_str in Info.dOpCode:
-            self.mkMode = Info.dOpCode[op_code_str]
+        # 유효한 OpCode인지 딕셔너리로 한번에 확인 (get 단일 조회 - in + [] 이중 해시 조회 제거)
+        # 모든 OpCode는 '$'(ReadingXlsRule)로 시작하므로 첫 글자 비교로 먼저 걸러 일반 텍스트 셀의 해시 계산 생략
+        if op_code_str[:1] == Info.ReadingXlsRule:
+            mk_mode = Info.dOpCode.get(op_code_str)
+        else:
+            mk_mode = None
+        if mk_mode is not None:
+            self.mkMode = mk_mode
         else:
             self.mkMode = EMkMode.NONE
-            # 빈 문자열이 아닐 경우에만 오류 기록
-            if op_code_str:
-                Info.WriteErrCell(EErrType.OpCode, self.ShtName, op_code_row, op_code_col)
+            # 빈 셀은 위에서 반환했으므로 여기서는 항상 잘못된 OpCode
+            Info.WriteErrCell(EErrType.OpCode, self.ShtName, op_code_row, op_code_col)
 
         # 이전 모드 갱신
         self.mkModeOld = self.mkMode
 
     def readRow(self, row):
         """OpCode에 따른 라인별 아이템 읽기 - 성능 최적화"""
-        # 열 위치 계산 최적화
-        if self.mkMode == EMkMode.PRJT_DEF:
+        # 열 위치 계산 최적화 (모드 판별을 한 번의 분기로 처리)
+        mk_mode = self.mkMode
+        if mk_mode == EMkMode.PRJT_DEF:
             self.dItem["Name"].Col = self.prjtDefCol
-        elif self.mkMode in [EMkMode.STR_MEM, EMkMode.ENUM_MEM]:
-            self.dItem["Name"].Col = self.memDfltCol
-        else:
-            self.dItem["Name"].Col = self.nameDfltCol
-
-        if self.mkMode == EMkMode.PRJT_DEF:
             self.dItem["Value"].Col = self.prjtNameCol
         else:
+            if mk_mode == EMkMode.STR_MEM or mk_mode == EMkMode.ENUM_MEM:
+                self.dItem["Name"].Col = self.memDfltCol
+            else:
+                self.dItem["Name"].Col = self.nameDfltCol
             self.dItem["Value"].Col = self.valDfltCol
 
         self.dItem["Description"].Col = self.descDfltCol
 
-        # 한번에 필요한 데이터 읽기 (캐싱 활용)
-        self.dItem["Keyword"].Str = self.cached_read_cell(row, self.dItem["Keyword"].Col)
-        self.dItem["Type"].Str = self.cached_read_cell(row, self.dItem["Type"].Col)
-        self.dItem["Name"].Str = self.cached_read_cell(row, self.dItem["Name"].Col)
-        self.dItem["Value"].Str = self.cached_read_cell(row, self.dItem["Value"].Col)
+        # 한번에 필요한 데이터 읽기 (행마다 한 번만 읽으므로 셀 캐시를 거치지 않음)
+        keyword_item = self.dItem["Keyword"]
+        type_item = self.dItem["Type"]
+        name_item = self.dItem["Name"]
+        value_item = self.dItem["Value"]
+        keyword_item.Str, type_item.Str, name_item.Str, value_item.Str = self.read_row_cells(
+            row, (keyword_item.Col, type_item.Col, name_item.Col, value_item.Col))
 
-        if self.mkMode == EMkMode.ARRAY:
+        if mk_mode == EMkMode.ARRAY:
             self.currentArr = f"{self.ShtName}_{self.dItem['Name'].Str}_{self.arrNameCnt}"
             self.arrNameCnt += 1
             arr_type = self.chkArrInfo(row)
@@ -446,7 +509,7 @@ class CalList:
                 self.dItem["Description"].Col = self.descDfltCol + self.dArr[self.currentArr].OrignalSize.Col
                 self.dItem["Value"].Str = ""
 
-        elif self.mkMode == EMkMode.PRJT_DEF:
+        elif mk_mode == EMkMode.PRJT_DEF:
             prjt_def = self.dItem["Name"].Str
             prjt_name = self.dItem["Value"].Str
 
@@ -455,15 +518,14 @@ class CalList:
                 self.dItem["Name"].Col = self.prjtDefCol + 1
                 self.dItem["Value"].Col = self.prjtNameCol + 1
 
-                prjt_def = self.cached_read_cell(row, self.prjtDefCol + 1)
-                prjt_name = self.cached_read_cell(row, self.prjtNameCol + 1)
+                prjt_def, prjt_name = self.read_row_cells(row, (self.prjtDefCol + 1, self.prjtNameCol + 1))
 
             self.dItem["Name"].Str = prjt_def
             self.dItem["Value"].Str = prjt_name
             self.dItem["Description"].Col = self.dItem["Value"].Col + 2
 
         # 설명 읽기는 다른 컬럼 처리 후에 한 번만 수행
-        self.dItem["Description"].Str = self.cached_read_cell(row, self.dItem["Description"].Col)
+        self.dItem["Description"].Str = self._cell_str(self._row_data(row), self.dItem["Description"].Col)
 
     def chkArrInfo(self, row):
         """배열 타입 체크"""
@@ -572,37 +634,34 @@ class CalList:
             read_size.Row = orignal_size.Row + 1
             read_size.Col = orignal_size.Col + 2
 
-        self.dArr[self.currentArr] = ArrInfos()
-        self.dArr[self.currentArr].OrignalSize = orignal_size
-        self.dArr[self.currentArr].ReadSize = read_size
-        self.dArr[self.currentArr].StartPos = start_pos
-        self.dArr[self.currentArr].EndPos = end_pos
-        self.dArr[self.currentArr].TempArr = []
-        self.dArr[self.currentArr].AlignmentSize = []
-        self.dArr[self.currentArr].AnnotateCol = []
-        self.dArr[self.currentArr].AnnotateRow = []
-        self.dArr[self.currentArr].ArrType = arr_type.value
-        self.dArr[self.currentArr].IdxOn = False
-        self.dArr[self.currentArr].LineAdd = False
-        self.dArr[self.currentArr].ArrayDataType = self.dItem["Type"].Str
+        # 위치/크기는 생성자로 바로 전달 (리스트/플래그는 ArrInfos 기본값이 새 빈 리스트/False)
+        arr_info = ArrInfos(orignal_size, read_size, start_pos, end_pos)
+        arr_info.ArrType = arr_type.value
+        arr_info.ArrayDataType = self.dItem["Type"].Str
+        self.dArr[self.currentArr] = arr_info
 
     def chkArrtype(self, row, arr_size):
         """배열 타입 확인"""
         rt = False
 
-        for col in range(self.memDfltCol + 1, self.memDfltCol + arr_size.Col):
-            cell_str = Info.ReadCell(self.shtData, row, col)
+        # 실제 행 길이를 넘는 열/시트 끝을 넘는 행은 항상 빈 셀이므로 검사 범위에서 제외
+        sht_data = self.shtData
+        row_cnt = len(sht_data)
+        max_col = max((len(sht_data[r]) for r in (row, row + 1) if r < row_cnt), default=0)
+
+        for col in range(self.memDfltCol + 1, min(self.memDfltCol + arr_size.Col, max_col)):
+            cell_str = Info.ReadCell(sht_data, row, col)
             if cell_str:
                 rt = True
                 break
 
-            cell_str = Info.ReadCell(self.shtData, row + 1, col)
+            cell_str = Info.ReadCell(sht_data, row + 1, col)
             if cell_str:
                 rt = True
                 break
 
         if not rt:
-            for r in range(row + 2, row + 2 + arr_size.Row):
+            for r in range(row + 2, min(row + 2 + arr_size.Row, row_cnt)):
                 cell_str = Info.ReadCell(self.shtData, r, self.memDfltCol)
                 if cell_str:
                     rt = True
@@ -617,28 +676,31 @@ class CalList:
             logging.error(f"currentArr '{self.currentArr}'가 dArr 딕셔너리에 없습니다.")
             return
 
+        # 현재 배열 정보는 셀마다 반복 조회하지 않도록 지역 변수로 한 번만 가져옴
+        arr = self.dArr[self.currentArr]
+
         # 조기 반환 조건 검사
-        if self.dArr[self.currentArr].ArrType == EArrType.SizeErr.value:
+        if arr.ArrType == EArrType.SizeErr.value:
             return
-        if self.dArr[self.currentArr].ArrType == EArrType.Type3.value and row != self.dArr[self.currentArr].StartPos.Row:
+        if arr.ArrType == EArrType.Type3.value and row != arr.StartPos.Row:
             return
 
         cell_lenth = 0
-        col = self.dArr[self.currentArr].StartPos.Col
+        col = arr.StartPos.Col
         temp_line = []
 
         # 배열 타입 확인 - FLOAT32인지 검사
         is_float32_array = "FLOAT32" in self.dItem["Type"].Str
 
         # 첫 번째 행 확인 (인덱스/레이블 행)
-        is_first_row = (row == self.dArr[self.currentArr].StartPos.Row)
+        is_first_row = (row == arr.StartPos.Row)
 
         # 첫 번째 행의 첫 번째 셀 확인 (타이틀 셀 여부 확인용)
-        first_cell_content = Info.ReadCell(self.shtData, row, self.dArr[self.currentArr].StartPos.Col)
+        first_cell_content = Info.ReadCell(self.shtData, row, arr.StartPos.Col)
         is_label_row = is_first_row or "Idx" in first_cell_content
 
         # 2차원 배열 확인
-        is_2d_array = self.dArr[self.currentArr].OrignalSize.Row > 1
+        is_2d_array = arr.OrignalSize.Row > 1
 
         # Cython 최적화 사용 (배열 멤버 읽기) - 04_Python_Migration 방식
         if False:  # USE_CYTHON_CAL_LIST - 임시 비활성화 (04_Python_Migration과 동일)
@@ -646,99 +708,100 @@ class CalList:
                 temp_line, alignment_sizes = fast_read_arr_mem_processing(
                     self.shtData,
                     row,
-                    self.dArr[self.currentArr].StartPos.Col,
-                    self.dArr[self.currentArr].EndPos.Col,
+                    arr.StartPos.Col,
+                    arr.EndPos.Col,
                     Info.ReadingXlsRule
                 )
 
                 # Alignment 크기 업데이트
                 for i, size in enumerate(alignment_sizes):
                     temp_col_pos = i
-                    if self.dArr[self.currentArr].ArrType == EArrType.Type3.value:
+                    if arr.ArrType == EArrType.Type3.value:
                         temp_col_pos %= 10
 
                     # AlignmentSize 리스트 확장
-                    while temp_col_pos >= len(self.dArr[self.currentArr].AlignmentSize):
-                        self.dArr[self.currentArr].AlignmentSize.append(0)
+                    while temp_col_pos >= len(arr.AlignmentSize):
+                        arr.AlignmentSize.append(0)
 
-                    if size > self.dArr[self.currentArr].AlignmentSize[temp_col_pos]:
-                        self.dArr[self.currentArr].AlignmentSize[temp_col_pos] = size
+                    if size > arr.AlignmentSize[temp_col_pos]:
+                        arr.AlignmentSize[temp_col_pos] = size
 
             except:
                 # Python 폴백
                 temp_line = []
-                col = self.dArr[self.currentArr].StartPos.Col
+                col = arr.StartPos.Col
+
+        # 셀 루프에서 변하지 않는 값은 루프 밖에서 한 번만 조회
+        # (StartPos/ArrType/규칙 기호는 고정, EndPos/ReadSize는 주석 처리 시 갱신되므로 매번 조회)
+        # 행은 한 번만 조회하고 셀마다 열 범위만 검사 (Info.ReadCell 호출/예외 처리 생략, 변환 규칙은 동일)
+        row_data = self._row_data(row)
+        cell_str_at = self._cell_str
+        rule = Info.ReadingXlsRule
+        start_row = arr.StartPos.Row
+        start_col = arr.StartPos.Col
+        is_type3 = arr.ArrType == EArrType.Type3.value
+        alignment_size = arr.AlignmentSize
 
         # 기존 Python 버전 (폴백)
-        while col < self.dArr[self.currentArr].EndPos.Col + 1:
+        while col < arr.EndPos.Col + 1:
             # 셀 데이터 읽기
-            cell_str = Info.ReadCell(self.shtData, row, col)
-
-            # 주석 위치인지 확인
-            is_annotation = (cell_str == Info.ReadingXlsRule)
-
-            # 주석 행/열 확인 (AnnotateRow, AnnotateCol 활용)
-            is_in_annotation_col = col - self.dArr[self.currentArr].StartPos.Col in self.dArr[self.currentArr].AnnotateCol
-            is_in_annotation_row = row - self.dArr[self.currentArr].StartPos.Row in self.dArr[self.currentArr].AnnotateRow
-
-            # 첫 번째 열 확인 (행 인덱스 열)
-            is_first_col = (col == self.dArr[self.currentArr].StartPos.Col)
+            cell_str = cell_str_at(row_data, col)
 
             # 빈 셀 처리
             if not cell_str:
-                if col != self.dArr[self.currentArr].StartPos.Col and col != self.dArr[self.currentArr].EndPos.Col and row != self.dArr[self.currentArr].StartPos.Row:
+                if col != start_col and col != arr.EndPos.Col and row != start_row:
                     Info.WriteErrCell(EErrType.EmptyCell, self.ShtName, row, col)
 
-            if self.dArr[self.currentArr].ArrType != EArrType.Type3.value:
-                if row == self.dArr[self.currentArr].StartPos.Row and col == self.dArr[self.currentArr].StartPos.Col:
+            if not is_type3:
+                if row == start_row and col == start_col:
                     # 첫 번째 셀은 보통 빈 셀이거나 "Idx"
                     if not cell_str:
                         cell_str = "Idx"
 
-                if cell_str == Info.ReadingXlsRule:
-                    if row == self.dArr[self.currentArr].StartPos.Row:  # Column에 주석 생성
-                        col_idx = col - self.dArr[self.currentArr].StartPos.Col
-                        if col_idx not in self.dArr[self.currentArr].AnnotateCol:
-                            self.dArr[self.currentArr].AnnotateCol.append(col_idx)
-                            self.dArr[self.currentArr].EndPos.Col += 1
-                            self.dArr[self.currentArr].ReadSize.Col += 1
-                    if col == self.dArr[self.currentArr].StartPos.Col:  # row에 주석 생성
-                        row_idx = row - self.dArr[self.currentArr].StartPos.Row
-                        if row_idx not in self.dArr[self.currentArr].AnnotateRow:
-                            self.dArr[self.currentArr].AnnotateRow.append(row_idx)
-                            self.dArr[self.currentArr].EndPos.Row += 1
-                            self.dArr[self.currentArr].ReadSize.Row += 1
+                if cell_str == rule:
+                    if row == start_row:  # Column에 주석 생성
+                        col_idx = col - start_col
+                        if col_idx not in arr.AnnotateCol:
+                            arr.AnnotateCol.append(col_idx)
+                            arr.EndPos.Col += 1
+                            arr.ReadSize.Col += 1
+                    if col == start_col:  # row에 주석 생성
+                        row_idx = row - start_row
+                        if row_idx not in arr.AnnotateRow:
+                            arr.AnnotateRow.append(row_idx)
+                            arr.EndPos.Row += 1
+                            arr.ReadSize.Row += 1
                 elif cell_str:  # 인덱스 생성
-                    if (row == self.dArr[self.currentArr].StartPos.Row and col > self.dArr[self.currentArr].StartPos.Col) or (row > self.dArr[self.currentArr].StartPos.Row and col == self.dArr[self.currentArr].StartPos.Col):
-                        self.dArr[self.currentArr].IdxOn = True
+                    if (row == start_row and col > start_col) or (row > start_row and col == start_col):
+                        arr.IdxOn = True
 
             # 첫 번째 행일 때 AlignmentSize 초기화
-            if row == self.dArr[self.currentArr].StartPos.Row:
-                if col - self.dArr[self.currentArr].StartPos.Col >= len(self.dArr[self.currentArr].AlignmentSize):
-                    self.dArr[self.currentArr].AlignmentSize.append(0)
+            if row == start_row:
+                if col - start_col >= len(alignment_size):
+                    alignment_size.append(0)
 
-            cell_str = cell_str.replace(Info.ReadingXlsRule, "")
+            cell_str = cell_str.replace(rule, "")
 
             # 열 위치 계산
-            temp_col_pos = col - self.dArr[self.currentArr].StartPos.Col
+            temp_col_pos = col - start_col
 
-            if self.dArr[self.currentArr].ArrType == EArrType.Type3.value:
+            if is_type3:
                 temp_col_pos %= 10
 
             # 안전장치: AlignmentSize 리스트 크기 확인 및 필요 시 확장
-            while temp_col_pos >= len(self.dArr[self.currentArr].AlignmentSize):
-                self.dArr[self.currentArr].AlignmentSize.append(0)
+            while temp_col_pos >= len(alignment_size):
+                alignment_size.append(0)
 
             temp_line.append(cell_str)
             cell_lenth = len(cell_str.encode('utf-8'))
 
             # 이제 안전하게 인덱스 접근 가능
-            if cell_lenth > self.dArr[self.currentArr].AlignmentSize[temp_col_pos]:
-                self.dArr[self.currentArr].AlignmentSize[temp_col_pos] = cell_lenth
+            if cell_lenth > alignment_size[temp_col_pos]:
+                alignment_size[temp_col_pos] = cell_lenth
 
             col += 1
 
-        self.dArr[self.currentArr].TempArr.append(temp_line)
+        arr.TempArr.append(temp_line)
 
     def readyArrMemMake(self):
         """배열 만들기 위한 준비 (인덱스 라인 확인, alignment 재조정)"""
@@ -837,8 +900,7 @@ class CalList:
             # 주석 행/열에서는 Float Suffix 적용 제외
             is_comment_context = (row in annotate_row_set or col in annotate_col_set or
                                 '/*' in cell_str or '//' in cell_str)
-            if (ENABLE_FLOAT_SUFFIX and hasattr(self, 'float_suffix_patterns') and self.float_suffix_patterns and
-                not is_comment_context):
+            if ENABLE_FLOAT_SUFFIX and self.float_suffix_patterns and not is_comment_context:
                 cell_str = self._apply_float_suffix(cell_str)
 
             # 주석 열 처리
@@ -878,9 +940,8 @@ class CalList:
                             padding = self.dArr[self.currentArr].AlignmentSize[col] - len(cell_str.encode('utf-8')) + 1
                             src_data_str += " ".ljust(padding) + "*/"
 
-                            # 빈 주석 처리
-                            temp = src_data_str.replace("/*", "").replace("*/", "").replace("{", "").replace("\t", "")
-                            if not temp.strip():
+                            # 빈 주석 처리 (기호 제거용 임시 문자열 생성 없이 정규식 1회 검사)
+                            if self.empty_comment_pattern.fullmatch(src_data_str):
                                 src_data_str = src_data_str.replace("/*", "  ").replace("*/", "  ")
 
                         antt_cnt += self.dArr[self.currentArr].AlignmentSize[col] + 3
@@ -980,10 +1041,19 @@ class CalList:
         return src_data_str
 
     def _apply_float_suffix(self, cell_str):
-        """셀 문자열에 Float Suffix 적용 (04_Python_Migration 방식 개선)"""
+        """셀 문자열에 Float Suffix 적용 (04_Python_Migration 방식 개선) - 결과 캐시"""
         if not cell_str:
             return cell_str
 
+        result = _float_suffix_cache.get(cell_str)
+        if result is None:
+            result = self._convert_float_suffix(cell_str)
+            if len(_float_suffix_cache) < _FLOAT_SUFFIX_CACHE_LIMIT:
+                _float_suffix_cache[cell_str] = result
+        return result
+
+    def _convert_float_suffix(self, cell_str):
+        """Float Suffix 변환 본체 (캐시 미스 시에만 호출)"""
         # Cython 버전 우선 사용 (성능 최적화)
         if ENABLE_FLOAT_SUFFIX and USE_CYTHON_CAL_LIST:
             fast_add_float_suffix = safe_import_cython_function('code_generator_v2', 'fast_add_float_suffix')
@@ -997,9 +1067,6 @@ class CalList:
         if not ENABLE_FLOAT_SUFFIX:
             return cell_str
 
-        # 정규식을 사용한 더 정확한 처리
-        import re
-
         # 이미 f 접미사가 있는 경우 그대로 반환
         if cell_str.endswith('f') or cell_str.endswith('F'):
             return cell_str
@@ -1010,11 +1077,12 @@ class CalList:
 
         try:
             # 단어별로 분리해서 처리 (정규식 중복 적용 방지)
-            words = re.split(r'(\s+|[^\w\.])', cell_str)
+            words = self.float_suffix_split_pattern.split(cell_str)
             result_words = []
+            number_match = self.float_suffix_number_pattern.match
 
             for word in words:
-                if not word or not re.match(r'^\d+\.?\d*$', word):
+                if not word or not number_match(word):
                     result_words.append(word)
                     continue
 
@@ -1070,7 +1138,7 @@ class CalList:
                     pass  # 실패 시 Python 폴백
 
         # Python 폴백 (정규식 버전)
-        if not hasattr(self, 'float_suffix_patterns') or not self.float_suffix_patterns:
+        if not self.float_suffix_patterns:
             return block_str
 
         # 주석 보존
@@ -1115,17 +1183,6 @@ class CalList:
 
         return block_str
 
-    def add_float_suffix(self, cell_str, array_type):
-        """
-        Float Suffix 추가 함수 (04_Python_Migration에서 이식)
-        FLOAT32 타입 배열의 숫자 값에 .f 접미사 추가
-        """
-        # FLOAT32 타입이 아니면 원본 반환
-        if not array_type or "FLOAT32" not in array_type:
-            return cell_str
-
-        return self._apply_float_suffix(cell_str)
-
     def setPragmaSection(self, key_str, row):
         """프라그마 설정"""
         if (self.pragSet or
@@ -1140,7 +1197,7 @@ class CalList:
                 op_code_str = self.dTempCode[self.currentTitle][i][0]
                 mode = Info.dOpCode[op_code_str]
 
-                if mode in [EMkMode.DESCRIPT, EMkMode.SUBTITLE, EMkMode.PRJT_DEF, EMkMode.TITLE, EMkMode.TITLE_S, EMkMode.TITLE_H]:
+                if mode in _PRAGMA_SKIP_MODES:
                     cnt += 1
                 else:
                     break
@@ -1199,13 +1256,13 @@ class CalList:
                 try:
                     errors = fast_chk_cal_list_processing(name_str, val_str, type_str, key_str, desc_str)
                     for error in errors:
-                        logging.debug(f"Validation error at row {row}: {error}")
+                        logging.debug("Validation error at row %d: %s", row, error)
                 except Exception as e:
                     logging.debug(f"Cython 검증 처리 중 오류 발생, Python 폴백 사용: {e}")
 
         # 기존 Python 버전 (상세 검증)
 
-        if self.mkMode in [EMkMode.TITLE, EMkMode.TITLE_S, EMkMode.TITLE_H]:
+        if self.mkMode in _TITLE_MODES:
             title = f"{self.mkMode.name}+{key_str}"
             if not title:
                 Info.WriteErrCell(EErrType.EmptyCell, self.ShtName, row, self.dItem["Keyword"].Col)
@@ -1339,15 +1396,9 @@ class CalList:
             if name_str != self.currentPrjtDef:
                 for i in range(self.prjtDepth, -1, -1):
                     if self.prjtList[i].Def == name_str:
+                        # 검증 단계에서는 상위 깊이 슬롯만 초기화 (#else/#endif 코드 문자열은 writeCalList에서 생성)
                         temp_depth = self.prjtDepth
                         for j in range(self.prjtDepth - i):
-                            tab_str = ""
-                            for k in range(temp_depth):
-                                tab_str += "\t"
-                            temp_str = tab_str + "#else\r\n"
-                            temp_str += tab_str + "\t#error undefined " + self.prjtList[self.prjtDepth - j].Def + " MACRO\r\n\r\n"
-                            temp_str += tab_str + "#endif\r\n\r\n"
-
                             self.prjtList[temp_depth] = SPrjtInfo(name_str, [])
                             temp_depth -= 1
 
@@ -1444,10 +1495,12 @@ class CalList:
         empty_src = False
         empty_hdr = False
 
-        if self.currentTitle in self.dSrcCode:
-            empty_src = Info.ExistEmptyStr(self.dSrcCode[self.currentTitle], 1)
-        if self.currentTitle in self.dHdrCode:
-            empty_hdr = Info.ExistEmptyStr(self.dHdrCode[self.currentTitle], 1)
+        src_code = self.dSrcCode.get(self.currentTitle)
+        if src_code is not None:
+            empty_src = Info.ExistEmptyStr(src_code, 1)
+        hdr_code = self.dHdrCode.get(self.currentTitle)
+        if hdr_code is not None:
+            empty_hdr = Info.ExistEmptyStr(hdr_code, 1)
 
         src_data_str = ""
         hdr_data_str = ""
@@ -1463,21 +1516,19 @@ class CalList:
         if CYTHON_CODE_GEN_AVAILABLE:
             try:
                 # 1. Excel 셀 값 처리 (Cython 직접 호출)
-                try:
-                    from excel_processor_v2 import process_cell_value_fast
+                process_cell_value_fast = safe_import_cython_function('excel_processor_v2', 'process_cell_value_fast', package_prefix='')
+                if process_cell_value_fast:
                     val_str = process_cell_value_fast(str(val_str))
-                except ImportError:
+                else:
                     val_str = str(val_str) if val_str is not None else ""
 
                 # 2. 데이터 타입 변환 (Cython 직접 호출)
                 if type_str and val_str:
-                    try:
-                        from data_processor import fast_data_type_conversion
+                    fast_data_type_conversion = safe_import_cython_function('data_processor', 'fast_data_type_conversion', package_prefix='')
+                    if fast_data_type_conversion:
                         converted_data = fast_data_type_conversion([val_str], type_str)
                         if converted_data and len(converted_data) > 0:
                             val_str = converted_data[0]
-                    except ImportError:
-                        pass
 
                 # 3. Float Suffix 처리 (이미 enhanced_excel_cell_processing에서 처리됨)
                 # 추가 Float Suffix 처리가 필요한 경우
@@ -1512,10 +1563,7 @@ class CalList:
             name_align = 15
             val_align = 15
 
-        if op_code_str in Info.dOpCode:
-           mk_mode = Info.dOpCode[op_code_str]
-        else:
-            mk_mode = EMkMode.NONE
+        mk_mode = Info.dOpCode.get(op_code_str, EMkMode.NONE)
 
         temp_list = []
 
@@ -1524,7 +1572,7 @@ class CalList:
         if desc_str:
             desc_str = "// " + desc_str
 
-        if mk_mode == EMkMode.TITLE or mk_mode == EMkMode.TITLE_S or mk_mode == EMkMode.TITLE_H:
+        if mk_mode in _TITLE_MODES:
             if self.prjtDepth >= 0:
                 for i in range(self.prjtDepth, -1, -1):
                     tab_str = ""
@@ -1997,7 +2045,7 @@ class CalList:
         if self.mkFile != EMkFile.Src:
             self.writeCode(mk_mode, hdr_data_str, False)
 
-        if mk_mode == EMkMode.TITLE or mk_mode == EMkMode.TITLE_S or mk_mode == EMkMode.TITLE_H or mk_mode == EMkMode.SUBTITLE or mk_mode == EMkMode.DESCRIPT or mk_mode == EMkMode.STR_DEF or mk_mode == EMkMode.ENUM_END or mk_mode == EMkMode.NONE or mk_mode == EMkMode.PRJT_DEF:
+        if mk_mode in _ALIGN_BREAK_MODES:
             self.alignCnt += 1
 
         # 생성된 코드 반환 (성능 저하 없는 Cython 최적화 완료)
@@ -2017,6 +2065,10 @@ class CalList:
                 self.frontTab += "\t"
 
         if code_str or mk_mode == EMkMode.DESCRIPT:
+            # 대상 코드 리스트는 한 번만 선택 (줄마다 src 분기/딕셔너리 조회 반복 방지)
+            code_list = self.dSrcCode[self.currentTitle] if src else self.dHdrCode[self.currentTitle]
+            front_tab = self.frontTab
+
             if "\r\n" in code_str:
                 if code_str.endswith("\r\n"):
                     temp = code_str[:-2]
@@ -2029,16 +2081,9 @@ class CalList:
                 if code_str.endswith("\r\n"):
                     split[-1] += "\r\n"
 
-                for item in split:
-                    if src:
-                        self.dSrcCode[self.currentTitle].append(self.frontTab + item)
-                    else:
-                        self.dHdrCode[self.currentTitle].append(self.frontTab + item)
+                code_list.extend([front_tab + item for item in split])
             else:
-                if src:
-                    self.dSrcCode[self.currentTitle].append(self.frontTab + code_str)
-                else:
-                    self.dHdrCode[self.currentTitle].append(self.frontTab + code_str)
+                code_list.append(front_tab + code_str)
 
         if mk_mode == EMkMode.PRJT_DEF and self.currentPrjtDef:
             self.frontTab += "\t"
@@ -2048,13 +2093,10 @@ class CalList:
         # 캐시 키 생성 (같은 매개변수로 호출되는 경우가 많음)
         cache_key = (align, str_len, type_flag, add_tab)
 
-        # 클래스에 캐시 딕셔너리가 없으면 생성
-        if not hasattr(self, 'pad_cache'):
-            self.pad_cache = {}
-
-        # 캐시에 결과가 있으면 반환
-        if cache_key in self.pad_cache:
-            return self.pad_cache[cache_key]
+        # 캐시에 결과가 있으면 반환 (pad_cache는 모듈 수준 _pad_cache를 시트 간 공유)
+        cached = self.pad_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # 계산 로직
         rt = 0
@@ -2200,35 +2242,4 @@ class CalList:
         for placeholder, comment in comments.items():
             modified_val = modified_val.replace(placeholder, comment)
 
-        return modified_val
-
-    # cal_list.py에 추가
-    def safe_get_from_dict(self, dict_obj, key, default=None):
-        """딕셔너리에서 안전하게 값 가져오기"""
-        if key in dict_obj:
-            return dict_obj[key]
-        logging.warning(f"딕셔너리 키 없음: {key}")
-        return default
-
-    def safe_get_from_list(self, list_obj, index, default=None):
-        """리스트에서 안전하게 값 가져오기"""
-        if 0 <= index < len(list_obj):
-            return list_obj[index]
-        logging.warning(f"리스트 인덱스 범위 초과: {index}, 크기: {len(list_obj)}")
-        return default
-
-        # cal_list.py에 추가
-    def safe_read_cell(self, row, col):
-        """셀 데이터 안전하게 읽기"""
-        try:
-            if self.shtData and 0 <= row < len(self.shtData):
-                if 0 <= col < len(self.shtData[row]):
-                    return Info.ReadCell(self.shtData, row, col)
-                else:
-                    logging.warning(f"열 인덱스 범위 초과: row={row}, col={col}, max_col={len(self.shtData[row])-1}")
-            else:
-                logging.warning(f"행 인덱스 범위 초과: row={row}, max_row={len(self.shtData)-1 if self.shtData else -1}")
-            return ""
-        except Exception as e:
-            logging.error(f"셀 읽기 오류: row={row}, col={col}, 오류={e}")
-            return ""
\ No newline at end of file
+        return modified_val
\ No newline at end of file
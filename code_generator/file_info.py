@@ -22,22 +22,28 @@ class FileInfo:
     
     def chk_position(self):
         """셀 위치 확인"""
+        # 제목 문자열 -> (셀 위치, 행 오프셋, 열 오프셋): 셀마다 dict 조회 1회로 판별
+        title_positions = {
+            Info.FilePathTitle: (self.file_path_read, 0, 1),
+            Info.SrcInfoTitle: (self.src_info_read, 1, 1),
+            Info.HdrInfoTitle: (self.hdr_info_read, 1, 1),
+            Info.PrgmInfoTitle: (self.prgm_info_read, 3, 0),
+        }
+
         for row in range(1, len(self.sht_data)):
-            for col in range(1, len(self.sht_data[row]) if row < len(self.sht_data) else 0):
-                cell_str = Info.ReadCell(self.sht_data, row, col)
-                if cell_str == Info.FilePathTitle:
-                    self.file_path_read.Row = row
-                    self.file_path_read.Col = col + 1
-                if cell_str == Info.SrcInfoTitle:
-                    self.src_info_read.Row = row + 1
-                    self.src_info_read.Col = col + 1
-                if cell_str == Info.HdrInfoTitle:
-                    self.hdr_info_read.Row = row + 1
-                    self.hdr_info_read.Col = col + 1
-                if cell_str == Info.PrgmInfoTitle:
-                    self.prgm_info_read.Row = row + 3
-                    self.prgm_info_read.Col = col
-                if cell_str == Info.XlsInfoTitle:
+            row_data = self.sht_data[row]
+            for col in range(1, len(row_data)):
+                cell_value = row_data[col]
+                if cell_value is None:
+                    continue
+                cell_str = str(cell_value).strip()
+
+                position = title_positions.get(cell_str)
+                if position is not None:
+                    cell_pos, row_offset, col_offset = position
+                    cell_pos.Row = row + row_offset
+                    cell_pos.Col = col + col_offset
+                elif cell_str == Info.XlsInfoTitle:
                     break
     
     def read_file_path(self):
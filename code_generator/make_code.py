@@ -13,16 +13,29 @@ import logging
 import sys
 
 # Cython 최적화 함수들을 필요할 때 동적으로 import (안전한 방식)
+# Cython 함수 import 결과 캐시 (import 실패 결과(None)도 캐시)
+_cython_function_cache = {}
+
 def safe_import_cython_function(module_name, function_name):
-    """Cython 함수를 안전하게 import하는 헬퍼 함수"""
+    """Cython 함수를 안전하게 import하는 헬퍼 함수 (결과 캐시)"""
+    cache_key = (module_name, function_name)
+    try:
+        return _cython_function_cache[cache_key]
+    except KeyError:
+        pass
+
     try:
         # cython_extensions 경로 추가
-        if not module_name.startswith('cython_extensions.'):
-            module_name = f'cython_extensions.{module_name}'
-        module = __import__(module_name, fromlist=[function_name])
-        return getattr(module, function_name)
+        full_module_name = module_name
+        if not full_module_name.startswith('cython_extensions.'):
+            full_module_name = f'cython_extensions.{full_module_name}'
+        module = __import__(full_module_name, fromlist=[function_name])
+        func = getattr(module, function_name)
     except (ImportError, AttributeError):
-        return None
+        func = None
+
+    _cython_function_cache[cache_key] = func
+    return func
 
 # 성능 설정 안전 import
 try:
@@ -167,7 +180,7 @@ class MakeCode:
                 raise RuntimeError(error_msg)
 
         logging.info(f"ReadXlstoCode 시작: 처리할 시트 수 = {len(self.cl)}")
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if memory_monitoring:
             process = psutil.Process(os.getpid())
@@ -185,14 +198,14 @@ class MakeCode:
                     progress = int((i / len(self.cl)) * 50)  # ReadXlstoCode는 전체의 50%
                     try:
                         # 더 상세한 정보 제공
-                        elapsed = time.time() - start_time
+                        elapsed = time.perf_counter() - start_time
                         progress_callback(progress, f"시트 처리 중: {self.cl[i].ShtName} ({i+1}/{len(self.cl)}) - {elapsed:.1f}초 경과")
                     except InterruptedError as e:
                         # 사용자가 취소한 경우
                         logging.info(f"사용자가 코드 생성을 취소했습니다: {str(e)}")
                         raise  # 예외를 상위로 전파
 
-                logging.info(f"시트 {i+1}/{len(self.cl)} 처리 중: {self.cl[i].ShtName}")
+                logging.info("시트 %d/%d 처리 중: %s", i + 1, len(self.cl), self.cl[i].ShtName)
 
                 # UI 응답성 유지 - 더 자주 호출
                 QApplication.processEvents()
@@ -205,7 +218,7 @@ class MakeCode:
                         raise MemoryError(f"메모리 사용량이 2GB를 초과했습니다. 현재: {current_memory:.1f}MB")
 
                 # 타임아웃 체크 (30분 제한)
-                elapsed_time = time.time() - start_time
+                elapsed_time = time.perf_counter() - start_time
                 if elapsed_time > 1800:  # 30분
                     logging.warning(f"ReadXlstoCode 타임아웃: {elapsed_time:.1f}초 경과")
                     raise TimeoutError(f"코드 생성이 30분을 초과했습니다. 현재까지 {i}/{len(self.cl)} 시트 처리 완료")
@@ -235,7 +248,7 @@ class MakeCode:
                         except InterruptedError:
                             raise
 
-                    logging.info(f"시트 {self.cl[i].ShtName} 처리 완료")
+                    logging.info("시트 %s 처리 완료", self.cl[i].ShtName)
 
                     # 프로젝트명 추가 (시트별로 처리하여 인덱스 일치 보장)
                     if self.cl[i].PrjtNameMain:
@@ -259,16 +272,16 @@ class MakeCode:
         if memory_monitoring:
             final_memory = process.memory_info().rss / 1024 / 1024  # MB
             memory_used = final_memory - initial_memory
-            logging.info(f"ReadXlstoCode 완료 (소요시간: {time.time() - start_time:.1f}초, 메모리 사용량: {memory_used:.1f}MB)")
+            logging.info(f"ReadXlstoCode 완료 (소요시간: {time.perf_counter() - start_time:.1f}초, 메모리 사용량: {memory_used:.1f}MB)")
         else:
-            logging.info(f"ReadXlstoCode 완료 (소요시간: {time.time() - start_time:.1f}초)")
+            logging.info(f"ReadXlstoCode 완료 (소요시간: {time.perf_counter() - start_time:.1f}초)")
 
     def ConvXlstoCode(self, source_file_name="", target_file_name="", progress_callback=None):
         """엑셀 파일 변환하여 코드 생성 - 응답성 개선"""
         import time
         from PySide6.QtWidgets import QApplication
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # 필수 객체 유효성 검사
         if self.fi is None:
@@ -279,7 +292,7 @@ class MakeCode:
         # 진행률 콜백 호출 - 더 상세한 정보 제공
         if progress_callback:
             try:
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 progress_callback(50, f"코드 변환 시작... ({elapsed:.1f}초 경과)")
             except InterruptedError as e:
                 # 사용자가 취소한 경우
@@ -291,7 +304,7 @@ class MakeCode:
 
         if progress_callback:
             try:
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 progress_callback(60, f"시작 코드 생성 중... ({elapsed:.1f}초 경과)")
             except InterruptedError as e:
                 logging.info(f"시작 코드 생성 중 사용자가 취소함: {str(e)}")
@@ -301,7 +314,7 @@ class MakeCode:
 
         if progress_callback:
             try:
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 progress_callback(70, f"파일 정보 코드 생성 중... ({elapsed:.1f}초 경과)")
             except InterruptedError as e:
                 logging.info(f"파일 정보 코드 생성 중 사용자가 취소함: {str(e)}")
@@ -311,7 +324,7 @@ class MakeCode:
 
         if progress_callback:
             try:
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 progress_callback(85, f"CAL 리스트 코드 생성 중... ({elapsed:.1f}초 경과)")
             except InterruptedError as e:
                 logging.info(f"CAL 리스트 코드 생성 중 사용자가 취소함: {str(e)}")
@@ -321,7 +334,7 @@ class MakeCode:
 
         if progress_callback:
             try:
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 progress_callback(95, f"종료 코드 생성 중... ({elapsed:.1f}초 경과)")
             except InterruptedError as e:
                 logging.info(f"종료 코드 생성 중 사용자가 취소함: {str(e)}")
@@ -331,13 +344,13 @@ class MakeCode:
 
         if progress_callback:
             try:
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 progress_callback(100, f"코드 생성 완료 (총 소요시간: {elapsed:.1f}초)")
             except InterruptedError as e:
                 logging.info(f"코드 생성 완료 단계에서 사용자가 취소함: {str(e)}")
                 raise
 
-        logging.info(f"ConvXlstoCode 완료 (소요시간: {time.time() - start_time:.1f}초)")
+        logging.info(f"ConvXlstoCode 완료 (소요시간: {time.perf_counter() - start_time:.1f}초)")
 
     def make_conv_info_code(self, source_file_name=""):
         """소스/헤더 파일 앞 부분에 파일 생성 정보 작성"""
@@ -388,10 +401,8 @@ class MakeCode:
         conv_info_lines.append("")
 
         # 소스 및 헤더 파일 모두에 추가 - UI 배치 최적화 (한 번에 추가)
-        for line in conv_info_lines:
-            self.lb_src.addItem(line)
-        for line in conv_info_lines:
-            self.lb_hdr.addItem(line)
+        self.lb_src.addItems(conv_info_lines)
+        self.lb_hdr.addItems(conv_info_lines)
 
     def make_start_code(self):
         """시작 코드 생성 - 성능 최적화"""
@@ -412,11 +423,9 @@ class MakeCode:
         hdr_lines[1:1] = ["*                                   H E A D E R   F I L E                                   *"]
 
         # 한 번에 추가
-        for line in src_lines:
-            self.lb_src.addItem(line)
+        self.lb_src.addItems(src_lines)
 
-        for line in hdr_lines:
-            self.lb_hdr.addItem(line)
+        self.lb_hdr.addItems(hdr_lines)
 
     def make_file_info_code(self, target_file_name=""):
         """파일 정보 코드 생성 - 안전성 강화"""
@@ -461,10 +470,8 @@ class MakeCode:
             self.fi.Write()
 
         # 소스/헤더 리스트를 한 번에 추가 - UI 배치 최적화
-        for src in self.fi.SrcList:
-            self.lb_src.addItem(src)
-        for hdr in self.fi.HdrList:
-            self.lb_hdr.addItem(hdr)
+        self.lb_src.addItems(self.fi.SrcList)
+        self.lb_hdr.addItems(self.fi.HdrList)
 
         # 인클루드 코드 생성 (최적화된 버전 사용)
         self.make_include_code(True, self.lb_src, target_file_name)
@@ -546,24 +553,12 @@ class MakeCode:
         lines.append(Info.EndAnnotation[1])
 
         # 한 번에 추가
-        for line in lines:
-            lb.addItem(line)
+        lb.addItems(lines)
 
     def make_cal_list_code(self):
-        """Cal 리스트를 코드로 생성 - Cython 성능 최적화"""
-        # Cython 최적화 적용 가능한 경우 빠른 처리
-        if USE_CYTHON_CODE_GEN:
-            # 대량 데이터 처리를 위한 Cython 최적화
-            all_temp_code_items = []
-            for title_name in self.titleList:
-                for sht in range(len(self.cl)):
-                    if title_name in self.cl[sht].dTempCode:
-                        all_temp_code_items.extend(self.cl[sht].dTempCode[title_name])
-
-            # Cython 최적화 버전으로 대량 처리 (임시 비활성화 - Float Suffix 오류 회피)
-            if False and all_temp_code_items:  # 임시로 비활성화
-                processed_items = fast_write_cal_list_processing(all_temp_code_items)
-                logging.info(f"✓ Cython 최적화로 {len(processed_items)}개 코드 항목 처리 완료")
+        """Cal 리스트를 코드로 생성"""
+        # (Cython 일괄 처리용 dTempCode 수집 패스는 해당 처리가 비활성화되어
+        #  결과가 사용되지 않으므로 생략 - 타이틀/시트 순회는 아래 두 패스만 수행)
 
         # 기존 Python 버전 (상세 처리)
         # 사전 처리 - 각 타이틀에 대한 정보 미리 수집
@@ -672,13 +667,11 @@ class MakeCode:
 
                 # 소스 코드 처리
                 if src_list:
-                    for line in src_list:
-                        src_buffer.append(f"{tab_str}{line.rstrip()}")
+                    src_buffer.extend([tab_str + line.rstrip() for line in src_list])
 
                 # 헤더 코드 처리
                 if hdr_list:
-                    for line in hdr_list:
-                        hdr_buffer.append(f"{tab_str}{line.rstrip()}")
+                    hdr_buffer.extend([tab_str + line.rstrip() for line in hdr_list])
 
             # 조건부 컴파일 종료 추가
             if self.prjt_def_title:
@@ -709,10 +702,8 @@ class MakeCode:
                     hdr_buffer.extend(else_lines)
 
             # 버퍼의 모든 라인을 한 번에 추가 - UI 배치 최적화
-            for line in src_buffer:
-                self.lb_src.addItem(line)
-            for line in hdr_buffer:
-                self.lb_hdr.addItem(line)
+            self.lb_src.addItems(src_buffer)
+            self.lb_hdr.addItems(hdr_buffer)
 
 
 
@@ -737,10 +728,8 @@ class MakeCode:
         ]
 
         # 한 번에 추가 - UI 배치 최적화
-        for line in src_lines:
-            self.lb_src.addItem(line)
-        for line in hdr_lines:
-            self.lb_hdr.addItem(line)
+        self.lb_src.addItems(src_lines)
+        self.lb_hdr.addItems(hdr_lines)
 
     def get_hdr_upper_name(self):
         """헤더 파일 이름 대문자 변환"""
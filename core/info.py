@@ -274,6 +274,9 @@ class Info:
 
 class CellInfos:
     """셀 정보 클래스"""
+    # 행마다 대량 생성/접근되므로 __slots__로 인스턴스 __dict__ 제거 (메모리 및 속성 접근 비용 절감)
+    __slots__ = ('Row', 'Col', 'Str')
+
     def __init__(self, row=0, col=0, str_val=""):
         self.Row = row
         self.Col = col
@@ -281,11 +284,16 @@ class CellInfos:
 
 class ArrInfos:
     """배열 정보 클래스"""
-    def __init__(self):
-        self.OrignalSize = SCellPos()
-        self.ReadSize = SCellPos()
-        self.StartPos = SCellPos()
-        self.EndPos = SCellPos()
+    __slots__ = ('OrignalSize', 'ReadSize', 'StartPos', 'EndPos',
+                 'TempArr', 'AlignmentSize', 'AnnotateRow', 'AnnotateCol',
+                 'ArrType', 'RowCnt', 'IdxOn', 'LineAdd', 'ElementType', 'ArrayDataType')
+
+    def __init__(self, orignal_size=None, read_size=None, start_pos=None, end_pos=None):
+        # 위치/크기 정보를 생성 시 바로 받아 기본 SCellPos 생성 후 덮어쓰는 낭비를 방지
+        self.OrignalSize = orignal_size if orignal_size is not None else SCellPos()
+        self.ReadSize = read_size if read_size is not None else SCellPos()
+        self.StartPos = start_pos if start_pos is not None else SCellPos()
+        self.EndPos = end_pos if end_pos is not None else SCellPos()
         
         self.TempArr = []
         self.AlignmentSize = []
@@ -297,21 +305,29 @@ class ArrInfos:
         self.IdxOn = False
         self.LineAdd = False
         self.ElementType = ""  # 배열 요소의 타입 정보 저장
+        self.ArrayDataType = ""  # 배열 데이터 타입 (setArrInfo에서 설정)
 
 class SCellPos:
     """셀 위치 구조체"""
+    __slots__ = ('Row', 'Col')
+
     def __init__(self, row=0, col=0):
         self.Row = row
         self.Col = col
 
 class SPrjtInfo:
     """프로젝트 정보 구조체"""
+    __slots__ = ('Def', 'Val')
+
     def __init__(self, def_val="", val=None):
         self.Def = def_val
         self.Val = val if val is not None else []
 
 class SPragInfo:
     """프라그마 정보 구조체"""
+    __slots__ = ('PreCode', 'ClassName', 'SetIstring', 'SetUstring',
+                 'SetAddrMode', 'EndIstring', 'EndUstring', 'EndCode')
+
     def __init__(self, pre_code="", class_name="", set_istring="", set_ustring="", 
                  set_addr_mode="", end_istring="", end_ustring="", end_code=""):
         self.PreCode = pre_code
@@ -325,6 +341,8 @@ class SPragInfo:
 
 class SShtInfo:
     """시트 정보 구조체"""
+    __slots__ = ('Name', 'Data')
+
     def __init__(self, name="", data=None):
         self.Name = name
         self.Data = data if data is not None else []
\ No newline at end of file
@@ -187,32 +187,6 @@ class DBHandlerV2:
             self.conn.rollback()
             raise
 
-    def get_sheets(self) -> List[Dict[str, Any]]:
-        """
-        모든 시트 목록 조회
-
-        Returns:
-            시트 목록
-        """
-        try:
-            self.cursor.execute(
-                '''SELECT id, name, is_dollar_sheet, sheet_order, source_file
-                   FROM sheets ORDER BY sheet_order, id'''
-            )
-            sheets = []
-            for row in self.cursor.fetchall():
-                sheets.append({
-                    'id': row[0],
-                    'name': row[1],
-                    'is_dollar_sheet': bool(row[2]),
-                    'order': row[3],
-                    'source_file': row[4]
-                })
-            return sheets
-        except Exception as e:
-            logging.error(f"시트 목록 조회 오류: {e}")
-            raise
-
     def get_sheet_by_id(self, sheet_id: int) -> Optional[Dict[str, Any]]:
         """특정 시트 정보 조회"""
         try:
@@ -393,16 +367,17 @@ class DBHandlerV2:
             batch_size = 50000  # 5만개씩 처리
             offset = 0
 
+            # 단일 쿼리 실행 후 fetchmany로 배치 수신
+            # (LIMIT/OFFSET 반복 시 배치마다 쿼리 재실행 + 앞 행 재스캔 비용 발생)
+            self.cursor.execute("""
+                SELECT row, col, value FROM cells
+                WHERE sheet_id = ? AND value IS NOT NULL AND value != ''
+                ORDER BY row, col
+            """, (sheet_id,))
+
             while True:
                 # 배치 단위로 셀 데이터 가져오기 (빈 값 제외)
-                self.cursor.execute("""
-                    SELECT row, col, value FROM cells
-                    WHERE sheet_id = ? AND value IS NOT NULL AND value != ''
-                    ORDER BY row, col
-                    LIMIT ? OFFSET ?
-                """, (sheet_id, batch_size, offset))
-
-                batch = self.cursor.fetchall()
+                batch = self.cursor.fetchmany(batch_size)
                 if not batch:
                     break
 
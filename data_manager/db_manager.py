@@ -127,38 +127,6 @@ class DBManager:
 
         return added_names
 
-    def remove_database(self, db_name: str) -> bool:
-        """
-        데이터베이스 제거
-
-        Args:
-            db_name: 제거할 DB 이름
-
-        Returns:
-            성공 여부
-        """
-        if db_name not in self.databases:
-            return False
-
-        try:
-            # DB 연결 해제
-            self.databases[db_name].disconnect()
-            del self.databases[db_name]
-
-            # 현재 DB가 제거된 경우 다른 DB로 전환
-            if self.current_db_name == db_name:
-                if self.databases:
-                    self.current_db_name = next(iter(self.databases.keys()))
-                else:
-                    self.current_db_name = None
-
-            logging.info(f"Database removed: {db_name}")
-            return True
-
-        except Exception as e:
-            logging.error(f"Failed to remove database {db_name}: {e}")
-            return False
-
     def switch_database(self, db_name: str) -> bool:
         """
         현재 활성 데이터베이스 전환
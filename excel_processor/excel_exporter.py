@@ -1,4 +1,3 @@
-import xlwings as xw
 import logging
 from data_manager.db_handler_v2 import DBHandlerV2
 import os
@@ -26,6 +25,9 @@ class ExcelExporter:
         logging.info(f"Excel 파일 내보내기: ID {file_id}")
 
         try:
+            # xlwings 지연 import (Excel 작업 시에만 로드 - 앱 시작 시간 단축)
+            import xlwings as xw
+
             # Excel 애플리케이션 시작
             app = xw.App(visible=False)
             wb = app.books.add()
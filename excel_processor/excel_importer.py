@@ -1,4 +1,3 @@
-import xlwings as xw
 import logging
 from data_manager.db_handler_v2 import DBHandlerV2
 import os
@@ -45,6 +44,9 @@ class ExcelImporter:
         wb = None
 
         try:
+            # xlwings 지연 import (Excel 작업 시에만 로드 - 앱 시작 시간 단축)
+            import xlwings as xw
+
             # Excel 파일 열기 (안전한 방식)
             app = xw.App(visible=False, add_book=False)
             app.display_alerts = False  # 경고 메시지 비활성화
@@ -1,8 +1,9 @@
 import sys
 import os
 import logging
+import time
 import traceback
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 # test
 # Qt 폰트 경고 메시지 숨기기 (간단한 해결책)
 os.environ['QT_LOGGING_RULES'] = 'qt.qpa.fonts=false'
@@ -16,7 +17,7 @@ from PySide6.QtWidgets import (
     QTextEdit, QListWidget, QComboBox
 )
 # 수정 후
-from PySide6.QtCore import Qt, QSize, Signal, Slot, QUrl, QSettings, QTimer
+from PySide6.QtCore import Qt, QSize, Signal, Slot, QUrl, QSettings, QTimer, QFileSystemWatcher
 from PySide6.QtGui import QAction, QIcon, QDesktopServices, QFont, QKeySequence
 
 from data_manager.db_handler_v2 import DBHandlerV2
@@ -26,7 +27,6 @@ from excel_processor.excel_exporter import ExcelExporter
 from ui.ui_components import TreeView, ExcelGridView # VirtualizedGridModel 사용하는 버전
 from core.data_parser import DataParser
 from utils.git_manager import GitManager, DBHistoryManager
-from ui.git_status_dialog import GitStatusDialog
 # from commit_dialog import CommitFileDialog  # 더 이상 사용하지 않음
 
 # 기존 코드 가져오기 (안전한 import)
@@ -123,7 +123,7 @@ class DetailedTerminalLogger:
             # 완성된 줄들을 로그에 기록
             for line in lines[:-1]:
                 if line.strip():  # 빈 줄이 아닌 경우만
-                    logging.log(self.log_level, f"{self.stream_name}: {line.strip()}")
+                    logging.log(self.log_level, "%s: %s", self.stream_name, line.strip())
 
     def flush(self):
         self.original_stream.flush()
@@ -143,7 +143,7 @@ def detailed_logged_subprocess_run(*args, **kwargs):
     """subprocess.run을 래핑하여 모든 출력을 상세하게 로그에 기록"""
     import time
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         # 명령어 정보 로깅
@@ -167,7 +167,7 @@ def detailed_logged_subprocess_run(*args, **kwargs):
         result = original_run(*args, **kwargs)
 
         # 실행 시간 계산
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
 
         # 결과 로깅
         logging.debug(f"⏱️  SUBPROCESS_TIME: {execution_time:.3f}초")
@@ -196,7 +196,7 @@ def detailed_logged_subprocess_run(*args, **kwargs):
         return result
 
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         cmd_str = ' '.join(args[0]) if isinstance(args[0], list) else str(args[0])
         logging.error(f"💥 SUBPROCESS_EXCEPTION: {cmd_str} - {str(e)} (실행시간: {execution_time:.3f}초)")
         logging.error(f"   📍 예외 타입: {type(e).__name__}")
@@ -205,6 +205,58 @@ def detailed_logged_subprocess_run(*args, **kwargs):
 
 # subprocess.run을 상세 로깅 버전으로 교체
 subprocess.run = detailed_logged_subprocess_run
+
+
+class ProgressUiThrottle:
+    """진행률 대화상자 갱신 주기 제한 (주기 이내의 보고는 최신 값만 보관했다가 단일 QTimer로 반영)"""
+
+    def __init__(self, dialog, interval):
+        self.dialog = dialog
+        self.interval = interval  # 초
+        self.last_shown = float('-inf')
+        self.pending = None  # (value, label) - 아직 표시하지 못한 최신 보고
+
+        self.timer = QTimer(dialog)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+
+    def report(self, value, label, force=False):
+        """
+        진행률 보고
+
+        Returns:
+            바로 표시했으면 True, 보류했으면 False (보류된 값은 주기가 지나면 타이머가 표시)
+        """
+        now = time.perf_counter()
+        elapsed = now - self.last_shown
+        if force or elapsed >= self.interval:
+            self.timer.stop()
+            self.pending = None
+            self._show(value, label, now)
+            return True
+
+        self.pending = (value, label)
+        if not self.timer.isActive():
+            self.timer.start(max(1, int((self.interval - elapsed) * 1000)))
+        return False
+
+    def flush(self):
+        """보류된 최신 보고 표시"""
+        if self.pending is not None:
+            value, label = self.pending
+            self.pending = None
+            self._show(value, label, time.perf_counter())
+
+    def stop(self):
+        """보류된 보고 폐기 (대화상자를 닫거나 다른 작업에 재사용하기 전에 호출)"""
+        self.timer.stop()
+        self.pending = None
+
+    def _show(self, value, label, now):
+        self.last_shown = now
+        self.dialog.setValue(value)
+        self.dialog.setLabelText(label)
+
 class OriginalFileSurrogate:
     """기존 코드(MakeCode 등)와의 호환성을 위한 원본 파일 데이터 대체 클래스"""
 
@@ -266,6 +318,29 @@ class OriginalFileSurrogate:
 class DBExcelEditor(QMainWindow):
     """DB 기반 Excel 뷰어/에디터 메인 클래스"""
 
+    # 코드 생성 진행률 UI 최소 갱신 간격 (초, 약 60Hz)
+    # 배치마다 호출되는 진행률 콜백이 다이얼로그 재그리기/이벤트 처리를 매번 유발하지 않도록 제한
+    PROGRESS_UI_UPDATE_INTERVAL = 1.0 / 60
+
+    # Git 상태 레이블 상태별 스타일시트 (최초 1회 생성 후 재사용)
+    GIT_STATUS_STYLES = {
+        status_type: f"""
+            QLabel {{
+                padding: 3px 8px;
+                border-radius: 3px;
+                font-size: 11px;
+                background-color: {background_color};
+                color: {color};
+            }}
+        """
+        for status_type, background_color, color in (
+            ("info", "#e3f2fd", "#1976d2"),
+            ("success", "#e8f5e8", "#2e7d32"),
+            ("error", "#ffebee", "#c62828"),
+            ("warning", "#fff3e0", "#ef6c00"),
+        )
+    }
+
     def __init__(self):
         """DBExcelEditor 초기화"""
         super().__init__()
@@ -321,10 +396,18 @@ class DBExcelEditor(QMainWindow):
                                "Git 설정이 필요합니다. 프로그램을 다시 시작해주세요.")
             sys.exit(1)
 
-        # Git 상태 자동 업데이트 타이머 (3초마다)
-        self.git_status_timer = QTimer()
-        self.git_status_timer.timeout.connect(self.update_git_status_display)
-        self.git_status_timer.start(3000)  # 3초마다 업데이트
+        # Git 상태 자동 업데이트 (.git 변경 감지 기반 - 3초 주기 폴링 대체)
+        # 연속 변경(커밋/체크아웃 중 다수 파일 갱신)은 단발성 타이머로 묶어서 한 번만 갱신
+        self.git_status_debounce_timer = QTimer(self)
+        self.git_status_debounce_timer.setSingleShot(True)
+        self.git_status_debounce_timer.setInterval(250)
+        self.git_status_debounce_timer.timeout.connect(self.on_git_state_changed)
+
+        self.git_status_timer = None  # 감시 설정 실패 시에만 폴링 타이머 사용
+        self.git_watcher = QFileSystemWatcher(self)
+        self.git_watcher.fileChanged.connect(self.schedule_git_status_update)
+        self.git_watcher.directoryChanged.connect(self.schedule_git_status_update)
+        self.setup_git_watcher()
 
         # 애플리케이션 종료 시 DB 연결 해제 보장
         QApplication.instance().aboutToQuit.connect(self.cleanup)
@@ -371,27 +454,6 @@ class DBExcelEditor(QMainWindow):
         except:
             pass  # 소멸자에서는 예외를 발생시키지 않음
 
-    def update_current_db_references(self):
-        """현재 활성 DB 참조를 업데이트 (기존 코드 호환성 유지)"""
-        self.db = self.db_manager.get_current_db()
-
-        if self.db:
-            # 관련 객체들도 현재 DB로 업데이트
-            self.importer = ExcelImporter(self.db)
-            self.exporter = ExcelExporter(self.db)
-            self.data_parser = DataParser()
-            self.file_surrogate = OriginalFileSurrogate(self.db)
-
-            # 그리드뷰에도 현재 DB 설정
-            if hasattr(self, 'grid_view'):
-                self.grid_view.set_db_handler(self.db)
-        else:
-            # DB가 없으면 모든 참조를 None으로 설정
-            self.importer = None
-            self.exporter = None
-            self.data_parser = None
-            self.file_surrogate = None
-
     def init_ui(self):
         """UI 초기화"""
         self.setWindowTitle(Info.APP_TITLE)
@@ -462,27 +524,9 @@ class DBExcelEditor(QMainWindow):
         git_panel = QWidget()
         git_layout = QHBoxLayout(git_panel)
         git_layout.setContentsMargins(5, 5, 5, 5)
-
-        # Git 상태 표시 레이블 (왼쪽에 배치)
-        self.git_status_label = QLabel("Git 상태 확인 중...")
-        self.git_status_label.setStyleSheet("""
-            QLabel {
-                padding: 3px 8px;
-                border-radius: 3px;
-                font-size: 11px;
-                background-color: #e3f2fd;
-                color: #1976d2;
-            }
-        """)
-        git_layout.addWidget(self.git_status_label)
-
-        # Git 상태 새로고침 버튼
-        self.git_refresh_button = QPushButton("↻")
-        self.git_refresh_button.setToolTip("Git 브랜치 정보 새로고침")
-        self.git_refresh_button.setFixedSize(32, 32)
-        self.git_refresh_button.clicked.connect(self.refresh_git_status)
-        self.git_refresh_button.setStyleSheet("""
-            QPushButton {
+        # 패널 내 위젯 스타일은 objectName 선택자로 한 번에 지정 (위젯별 개별 파싱 방지)
+        git_panel.setStyleSheet("""
+            QPushButton#GitRefreshButton {
                 padding: 4px;
                 font-size: 14px;
                 background-color: #f8f9fa;
@@ -490,26 +534,14 @@ class DBExcelEditor(QMainWindow):
                 border: 1px solid #dee2e6;
                 border-radius: 4px;
             }
-            QPushButton:hover {
+            QPushButton#GitRefreshButton:hover {
                 background-color: #e9ecef;
                 border-color: #adb5bd;
             }
-            QPushButton:pressed {
+            QPushButton#GitRefreshButton:pressed {
                 background-color: #dee2e6;
             }
-        """)
-        git_layout.addWidget(self.git_refresh_button)
-
-        # 브랜치 전환 드롭다운
-        branch_label = QLabel("브랜치 전환:")
-        git_layout.addWidget(branch_label)
-
-        self.branch_combo = QComboBox()
-        self.branch_combo.setToolTip("브랜치를 선택하여 전환합니다")
-        self.branch_combo.setMinimumWidth(150)
-        self.branch_combo.currentTextChanged.connect(self.on_branch_changed)
-        self.branch_combo.setStyleSheet("""
-            QComboBox {
+            QComboBox#BranchCombo {
                 padding: 4px 8px;
                 font-size: 11px;
                 border: 1px solid #ced4da;
@@ -517,49 +549,41 @@ class DBExcelEditor(QMainWindow):
                 background-color: white;
                 color: #333;
             }
-            QComboBox:hover {
+            QComboBox#BranchCombo:hover {
                 border-color: #80bdff;
             }
-            QComboBox::drop-down {
+            QComboBox#BranchCombo::drop-down {
                 border: none;
                 background-color: #f8f9fa;
             }
-            QComboBox::down-arrow {
+            QComboBox#BranchCombo::down-arrow {
                 image: none;
                 border-left: 4px solid transparent;
                 border-right: 4px solid transparent;
                 border-top: 4px solid #666;
                 margin-right: 8px;
             }
-            QComboBox QAbstractItemView {
+            QComboBox#BranchCombo QAbstractItemView {
                 background-color: white;
                 border: 1px solid #ced4da;
                 selection-background-color: #007bff;
                 selection-color: white;
                 color: #333;
             }
-            QComboBox QAbstractItemView::item {
+            QComboBox#BranchCombo QAbstractItemView::item {
                 padding: 6px 8px;
                 border: none;
                 color: #333;
             }
-            QComboBox QAbstractItemView::item:selected {
+            QComboBox#BranchCombo QAbstractItemView::item:selected {
                 background-color: #007bff;
                 color: white;
             }
-            QComboBox QAbstractItemView::item:hover {
+            QComboBox#BranchCombo QAbstractItemView::item:hover {
                 background-color: #e3f2fd;
                 color: #1976d2;
             }
-        """)
-        git_layout.addWidget(self.branch_combo)
-
-        # Git 변경사항 확인 버튼
-        self.git_status_button = QPushButton("변경사항 확인")
-        self.git_status_button.setToolTip("Git 변경사항 확인 및 커밋/푸시 (DB 자동 닫기)")
-        self.git_status_button.clicked.connect(self.show_git_status)
-        self.git_status_button.setStyleSheet("""
-            QPushButton {
+            QPushButton#GitStatusButton {
                 padding: 6px 12px;
                 font-size: 11px;
                 background-color: #17a2b8;
@@ -567,20 +591,10 @@ class DBExcelEditor(QMainWindow):
                 border: none;
                 border-radius: 4px;
             }
-            QPushButton:hover {
+            QPushButton#GitStatusButton:hover {
                 background-color: #138496;
             }
-        """)
-        git_layout.addWidget(self.git_status_button)
-
-        git_layout.addStretch()  # 중간 공간 확보
-
-        # 원격 기준 초기화 버튼 (우측 상단에 배치)
-        self.reset_to_remote_button = QPushButton("원격 기준으로 초기화")
-        self.reset_to_remote_button.setToolTip("원격 저장소 기준으로 로컬을 리셋합니다 (clean 명령어 제외)")
-        self.reset_to_remote_button.clicked.connect(self.reset_to_remote)
-        self.reset_to_remote_button.setStyleSheet("""
-            QPushButton {
+            QPushButton#ResetToRemoteButton {
                 padding: 6px 12px;
                 font-size: 11px;
                 background-color: #dc3545;
@@ -588,10 +602,50 @@ class DBExcelEditor(QMainWindow):
                 border: none;
                 border-radius: 4px;
             }
-            QPushButton:hover {
+            QPushButton#ResetToRemoteButton:hover {
                 background-color: #c82333;
             }
         """)
+
+        # Git 상태 표시 레이블 (왼쪽에 배치)
+        self.git_status_label = QLabel("Git 상태 확인 중...")
+        self.git_status_label.setStyleSheet(self.GIT_STATUS_STYLES["info"])
+        self._git_status_style_type = "info"
+        git_layout.addWidget(self.git_status_label)
+
+        # Git 상태 새로고침 버튼
+        self.git_refresh_button = QPushButton("↻")
+        self.git_refresh_button.setObjectName("GitRefreshButton")
+        self.git_refresh_button.setToolTip("Git 브랜치 정보 새로고침")
+        self.git_refresh_button.setFixedSize(32, 32)
+        self.git_refresh_button.clicked.connect(self.refresh_git_status)
+        git_layout.addWidget(self.git_refresh_button)
+
+        # 브랜치 전환 드롭다운
+        branch_label = QLabel("브랜치 전환:")
+        git_layout.addWidget(branch_label)
+
+        self.branch_combo = QComboBox()
+        self.branch_combo.setObjectName("BranchCombo")
+        self.branch_combo.setToolTip("브랜치를 선택하여 전환합니다")
+        self.branch_combo.setMinimumWidth(150)
+        self.branch_combo.currentTextChanged.connect(self.on_branch_changed)
+        git_layout.addWidget(self.branch_combo)
+
+        # Git 변경사항 확인 버튼
+        self.git_status_button = QPushButton("변경사항 확인")
+        self.git_status_button.setObjectName("GitStatusButton")
+        self.git_status_button.setToolTip("Git 변경사항 확인 및 커밋/푸시 (DB 자동 닫기)")
+        self.git_status_button.clicked.connect(self.show_git_status)
+        git_layout.addWidget(self.git_status_button)
+
+        git_layout.addStretch()  # 중간 공간 확보
+
+        # 원격 기준 초기화 버튼 (우측 상단에 배치)
+        self.reset_to_remote_button = QPushButton("원격 기준으로 초기화")
+        self.reset_to_remote_button.setObjectName("ResetToRemoteButton")
+        self.reset_to_remote_button.setToolTip("원격 저장소 기준으로 로컬을 리셋합니다 (clean 명령어 제외)")
+        self.reset_to_remote_button.clicked.connect(self.reset_to_remote)
         git_layout.addWidget(self.reset_to_remote_button)
 
         right_layout.addWidget(git_panel)
@@ -1190,14 +1244,18 @@ class DBExcelEditor(QMainWindow):
                 all_sheets = []
                 logging.info("열린 DB가 없습니다. 시트 목록을 비웁니다.")
             else:
-                # 모든 경우에 다중 DB 처리 방식 사용 (일관성 보장)
-                all_sheets_info = self.db_manager.get_all_sheets_info()
-                logging.info(f"🔄 다중 DB 시트 정보: {list(all_sheets_info.keys())}")
+                logging.info(f"🔄 다중 DB 목록: {self.db_manager.get_database_names()}")
 
                 # 현재 활성 DB의 시트만 표시 (UI 혼란 방지)
+                # 표시하지 않는 다른 DB의 시트 목록까지 매번 조회하지 않도록 활성 DB만 조회
                 current_db_name = self.db_manager.current_db_name
-                if current_db_name and current_db_name in all_sheets_info:
-                    all_sheets = all_sheets_info[current_db_name]
+                current_db = self.db_manager.get_database(current_db_name) if current_db_name else None
+                if current_db is not None:
+                    try:
+                        all_sheets = current_db.get_sheets()
+                    except Exception as e:
+                        logging.error(f"Failed to get sheets from database {current_db_name}: {e}")
+                        all_sheets = []
                     logging.info(f"🔄 현재 활성 DB '{current_db_name}'에서 {len(all_sheets)}개 시트 로드")
 
                     # 각 시트에 DB 정보 추가
@@ -2161,6 +2219,9 @@ class DBExcelEditor(QMainWindow):
             successful_imports = []
             failed_imports = []
 
+            # 저장 디렉토리는 1회만 스캔하고 중복 파일명 검사는 집합으로 처리
+            existing_names = self._scan_dir_names(save_directory)
+
             # 현재 DB 상태 백업 (복원용)
             original_db_state = {
                 'db': self.db,
@@ -2182,7 +2243,7 @@ class DBExcelEditor(QMainWindow):
                     logging.info(f"다중 Excel → DB 변환 [{i+1}/{len(file_paths)}]: {file_path}")
 
                     # 각 파일을 독립적으로 처리 (단일 파일 변환과 동일한 방식)
-                    result = self.process_single_excel_import_isolated(file_path, save_directory)
+                    result = self.process_single_excel_import_isolated(file_path, save_directory, existing_names)
 
                     if result:
                         successful_imports.append({
@@ -2246,11 +2307,12 @@ class DBExcelEditor(QMainWindow):
             QMessageBox.critical(self, "다중 변환 오류", error_msg)
             self.statusBar.showMessage("다중 Excel → DB 변환 실패")
 
-    def process_single_excel_import_isolated(self, file_path, save_directory):
+    def process_single_excel_import_isolated(self, file_path, save_directory, existing_names=None):
         """
         독립적인 단일 Excel 가져오기 (다중 처리용 - 안정성 강화)
 
         각 파일을 완전히 독립적으로 처리하여 데이터 손실 방지
+        existing_names: save_directory 엔트리 이름 집합 (호출자가 1회 스캔 후 전달, 생성 시 갱신)
         """
         db_handler = None
         importer = None
@@ -2259,20 +2321,15 @@ class DBExcelEditor(QMainWindow):
             # 기본 DB 파일명 생성 (엑셀 파일명과 동일, 확장자는 .db)
             excel_basename = os.path.basename(file_path)
             excel_filename_only = os.path.splitext(excel_basename)[0]
-            default_db_name = f"{excel_filename_only}.db"
+
+            # 파일이 이미 존재하는 경우 고유한 이름 생성 (디렉토리 스캔 결과로 판단)
+            if existing_names is None:
+                existing_names = self._scan_dir_names(save_directory)
+            default_db_name = self._make_unique_db_name(excel_filename_only, existing_names)
 
             # 자동으로 DB 파일 경로 생성 (사용자 선택 없이)
             db_file_path = os.path.join(save_directory, default_db_name)
 
-            # 파일이 이미 존재하는 경우 고유한 이름 생성
-            counter = 1
-            original_db_path = db_file_path
-            while os.path.exists(db_file_path):
-                name_without_ext = os.path.splitext(original_db_path)[0]
-                db_file_path = f"{name_without_ext}_{counter}.db"
-                default_db_name = f"{excel_filename_only}_{counter}.db"
-                counter += 1
-
             logging.info(f"독립적 Excel → DB 변환: {file_path} → {db_file_path}")
 
             # 새로운 독립적인 DB 핸들러 생성 (기존 연결과 분리)
@@ -2373,6 +2430,9 @@ class DBExcelEditor(QMainWindow):
             successful_imports = []
             failed_imports = []
 
+            # 저장 디렉토리는 1회만 스캔하고 중복 파일명 검사는 집합으로 처리
+            existing_names = self._scan_dir_names(save_directory)
+
             for i, file_path in enumerate(file_paths):
                 if progress.wasCanceled():
                     break
@@ -2385,16 +2445,10 @@ class DBExcelEditor(QMainWindow):
                 try:
                     # 기본 DB 파일명 생성
                     excel_filename_only = os.path.splitext(excel_basename)[0]
-                    db_filename = f"{excel_filename_only}.db"
-                    db_file_path = os.path.join(save_directory, db_filename)
 
-                    # 파일이 이미 존재하는 경우 고유한 이름 생성
-                    counter = 1
-                    original_db_path = db_file_path
-                    while os.path.exists(db_file_path):
-                        name_without_ext = os.path.splitext(original_db_path)[0]
-                        db_file_path = f"{name_without_ext}_{counter}.db"
-                        counter += 1
+                    # 파일이 이미 존재하는 경우 고유한 이름 생성 (디렉토리 스캔 결과로 판단)
+                    db_filename = self._make_unique_db_name(excel_filename_only, existing_names)
+                    db_file_path = os.path.join(save_directory, db_filename)
 
                     logging.info(f"다중 가져오기 [{i+1}/{len(file_paths)}]: {file_path} -> {db_file_path}")
 
@@ -2721,6 +2775,8 @@ class DBExcelEditor(QMainWindow):
 
     def generate_code_for_single_db(self, selected_db: 'DBHandlerV2', output_dir: str):
         """단일 DB에 대한 코드 생성 - 응답성 개선"""
+        import time
+
         # 선택된 DB로 전환
         if self.db_manager.get_current_db() != selected_db:
             # 선택된 DB의 이름 찾기
@@ -2746,6 +2802,9 @@ class DBExcelEditor(QMainWindow):
             progress.setLabelText("코드 생성 준비 중...")
             QApplication.processEvents()
 
+            # 코드 생성 중 진행률 보고는 약 60Hz로 제한 (보류된 최신 보고는 타이머로 반영)
+            progress_throttle = ProgressUiThrottle(progress, self.PROGRESS_UI_UPDATE_INTERVAL)
+
             # 1. 현재 편집 중인 시트 저장 (선택사항이지만 권장)
             if self.current_sheet_id is not None:
                 progress.setValue(5)
@@ -2929,9 +2988,9 @@ class DBExcelEditor(QMainWindow):
             # 3. 각 그룹별로 코드 생성 (하나의 파일로)
             for group_idx, (group_name, group_data) in enumerate(d_xls.items()):
                 # 진행률 업데이트 (코드 생성 단계)
+                # (직접 표시하는 단계 보고는 force로 반영해 보류된 이전 그룹 보고가 덮어쓰지 않도록 함)
                 progress_val = 50 + int((group_idx / len(d_xls)) * 45)  # 50-95% 범위
-                progress.setValue(progress_val)
-                progress.setLabelText(f"'{group_name}' 그룹 처리 중 ({group_idx+1}/{len(d_xls)})")
+                progress_throttle.report(progress_val, f"'{group_name}' 그룹 처리 중 ({group_idx+1}/{len(d_xls)})", force=True)
                 QApplication.processEvents()
 
                 # 취소 확인
@@ -2992,9 +3051,11 @@ class DBExcelEditor(QMainWindow):
                         group_progress = 50 + int((group_idx / len(d_xls)) * 45)  # 50-95% 범위
                         total_progress = min(95, group_progress + int(progress_val * 0.45 / 100))
 
-                        progress.setValue(total_progress)
-                        progress.setLabelText(f"[{group_idx+1}/{len(d_xls)}] {group_name}: {message}")
-                        QApplication.processEvents()
+                        # 갱신 주기 이내의 보고는 최신 값만 보류 후 타이머로 표시 (완료(100) 보고는 즉시 반영)
+                        if progress_throttle.report(total_progress,
+                                                    f"[{group_idx+1}/{len(d_xls)}] {group_name}: {message}",
+                                                    force=progress_val >= 100):
+                            QApplication.processEvents()
 
                     # 시트 정보 검증 (C# 버전과 동일한 순서)
                     if make_code.ChkShtInfo():
@@ -3042,13 +3103,11 @@ class DBExcelEditor(QMainWindow):
 
                     # 소스 파일 저장
                     with open(src_file_path, 'w', encoding='utf-8') as f_src:
-                        for i in range(lb_src.count()):
-                            f_src.write(lb_src.item(i).text() + '\n')
+                        f_src.write(''.join(lb_src.item(i).text() + '\n' for i in range(lb_src.count())))
 
                     # 헤더 파일 저장
                     with open(hdr_file_path, 'w', encoding='utf-8') as f_hdr:
-                        for i in range(lb_hdr.count()):
-                            f_hdr.write(lb_hdr.item(i).text() + '\n')
+                        f_hdr.write(''.join(lb_hdr.item(i).text() + '\n' for i in range(lb_hdr.count())))
 
                     # 성공 메시지 및 파일 정보 기록
                     result_message += f"✅ 그룹 '{group_name}' 코드 생성 완료:\n"
@@ -3075,8 +3134,7 @@ class DBExcelEditor(QMainWindow):
                     del lb_hdr
 
             # 6. 최종 결과 표시 - 더 상세한 완료 메시지
-            progress.setValue(95)
-            progress.setLabelText("결과 정리 중...")
+            progress_throttle.report(95, "결과 정리 중...", force=True)
             QApplication.processEvents()
 
             if has_errors:
@@ -3086,12 +3144,10 @@ class DBExcelEditor(QMainWindow):
                 final_msg = f"코드 생성 완료: 모든 {len(d_xls)}개 그룹 성공"
                 logging.info("Code generation completed successfully.")
 
-            progress.setValue(100)
-            progress.setLabelText(f"완료 {len(generated_files_info)}개 파일 생성됨")
+            progress_throttle.report(100, f"완료 {len(generated_files_info)}개 파일 생성됨", force=True)
             QApplication.processEvents()
 
             # 잠시 완료 메시지 표시
-            import time
             time.sleep(0.5)
 
             self.statusBar.showMessage(final_msg)
@@ -3124,6 +3180,9 @@ class DBExcelEditor(QMainWindow):
             QMessageBox.critical(self, "코드 생성 오류", error_msg)
             self.statusBar.showMessage("코드 생성 중 심각한 오류 발생")
         finally:
+            # 보류된 진행률 보고 폐기
+            if 'progress_throttle' in locals():
+                progress_throttle.stop()
             # 진행률 대화상자가 열려있다면 닫기
             if 'progress' in locals() and progress.isVisible():
                 progress.close()
@@ -3134,7 +3193,7 @@ class DBExcelEditor(QMainWindow):
 
         try:
             logging.info(f"=== 개선된 다중 DB 코드 생성 시작: {len(selected_dbs)}개 DB ===")
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # 진행률 대화상자 생성
             from PySide6.QtWidgets import QProgressDialog
@@ -3157,7 +3216,7 @@ class DBExcelEditor(QMainWindow):
                 QApplication.processEvents()
 
                 # 타임아웃 체크 (전체 다중 DB 처리에 대해 1시간 제한)
-                elapsed_time = time.time() - start_time
+                elapsed_time = time.perf_counter() - start_time
                 if elapsed_time > 3600:  # 1시간
                     logging.warning(f"다중 DB 코드 생성 타임아웃: {elapsed_time:.1f}초 경과")
                     failed_generations.append({
@@ -3202,17 +3261,20 @@ class DBExcelEditor(QMainWindow):
                     logging.info(f"코드 생성 완료: 결과 메시지 길이 {len(result_message)}, 파일 정보 {len(generated_files_info)}개")
 
                     # 실제 생성된 파일만 수집 (코드 생성 후 새로 생긴 파일들)
+                    # os.scandir 사용: 디렉토리 엔트리에 캐시된 stat 정보 재사용 (파일별 추가 stat 호출 제거)
                     generated_files = []
+                    generated_names = set()  # 중복 체크용 파일명 집합 (목록 전체 재탐색 방지)
                     if os.path.exists(db_output_dir):
-                        for file_name in os.listdir(db_output_dir):
-                            if file_name.endswith(('.c', '.h')) and file_name not in existing_files:
-                                file_path = os.path.join(db_output_dir, file_name)
-                                file_size = os.path.getsize(file_path)
-                                generated_files.append({
-                                    'name': file_name,
-                                    'size': file_size,
-                                    'type': 'C 소스' if file_name.endswith('.c') else 'C 헤더'
-                                })
+                        with os.scandir(db_output_dir) as entries:
+                            for entry in entries:
+                                file_name = entry.name
+                                if file_name.endswith(('.c', '.h')) and file_name not in existing_files:
+                                    generated_files.append({
+                                        'name': file_name,
+                                        'size': entry.stat().st_size,
+                                        'type': 'C 소스' if file_name.endswith('.c') else 'C 헤더'
+                                    })
+                                    generated_names.add(file_name)
 
                     # generated_files_info에서도 파일 정보 추가 (중복 제거)
                     for file_info in generated_files_info:
@@ -3220,7 +3282,7 @@ class DBExcelEditor(QMainWindow):
                         hdr_file = file_info.get('hdr_file')
 
                         # 소스 파일 추가 (중복 체크)
-                        if src_file and not any(f['name'] == src_file for f in generated_files):
+                        if src_file and src_file not in generated_names:
                             src_path = file_info.get('src_path')
                             if src_path and os.path.exists(src_path):
                                 generated_files.append({
@@ -3228,10 +3290,11 @@ class DBExcelEditor(QMainWindow):
                                     'size': os.path.getsize(src_path),
                                     'type': 'C 소스'
                                 })
+                                generated_names.add(src_file)
                                 logging.info(f"추가된 소스 파일: {src_file} ({os.path.getsize(src_path)} bytes)")
 
                         # 헤더 파일 추가 (중복 체크)
-                        if hdr_file and not any(f['name'] == hdr_file for f in generated_files):
+                        if hdr_file and hdr_file not in generated_names:
                             hdr_path = file_info.get('hdr_path')
                             if hdr_path and os.path.exists(hdr_path):
                                 generated_files.append({
@@ -3239,6 +3302,7 @@ class DBExcelEditor(QMainWindow):
                                     'size': os.path.getsize(hdr_path),
                                     'type': 'C 헤더'
                                 })
+                                generated_names.add(hdr_file)
                                 logging.info(f"추가된 헤더 파일: {hdr_file} ({os.path.getsize(hdr_path)} bytes)")
 
                     logging.info(f"최종 생성된 파일 목록: {len(generated_files)}개 - {[f['name'] for f in generated_files]}")
@@ -3290,7 +3354,7 @@ class DBExcelEditor(QMainWindow):
             progress.close()
 
             # 배치 처리 완료 - 통합 결과 표시
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             logging.info(f"다중 DB 코드 생성 완료 (총 소요시간: {total_time:.1f}초)")
             self.show_multiple_code_generation_result_improved(successful_generations, failed_generations, output_dir)
 
@@ -3474,17 +3538,20 @@ class DBExcelEditor(QMainWindow):
         """단일 DB와 동일한 방식으로 실제 MakeCode를 사용한 코드 생성 - 응답성 개선"""
         import time
 
+        # 진행률 보고는 약 60Hz로 제한 (보류된 최신 보고는 타이머로 반영)
+        progress_throttle = ProgressUiThrottle(progress_dialog, self.PROGRESS_UI_UPDATE_INTERVAL) if progress_dialog else None
+
         try:
             db_name = os.path.basename(db_handler.db_file)
             logging.info(f"=== 실제 MakeCode 사용 코드 생성 시작: {db_name} ===")
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # 진행률 콜백 함수 정의
             def progress_callback(progress, message):
                 if progress_dialog:
-                    progress_dialog.setValue(progress)
-                    progress_dialog.setLabelText(message)
-                    QApplication.processEvents()
+                    # 갱신 주기 이내의 보고는 보류 (완료(100) 보고는 즉시 반영)
+                    if progress_throttle.report(progress, message, force=progress >= 100):
+                        QApplication.processEvents()
 
                     # 사용자가 취소했는지 확인
                     if progress_dialog.wasCanceled():
@@ -3556,8 +3623,7 @@ class DBExcelEditor(QMainWindow):
                 src_filename = f"{os.path.splitext(os.path.basename(db_handler.db_file))[0]}.c"
                 src_file_path = os.path.join(output_dir, src_filename)
                 with open(src_file_path, 'w', encoding='utf-8') as f:
-                    for i in range(lb_src.count()):
-                        f.write(lb_src.item(i).text() + '\n')
+                    f.write(''.join(lb_src.item(i).text() + '\n' for i in range(lb_src.count())))
                 src_files.append(src_filename)
 
             # 헤더 파일 저장
@@ -3565,14 +3631,13 @@ class DBExcelEditor(QMainWindow):
                 hdr_filename = f"{os.path.splitext(os.path.basename(db_handler.db_file))[0]}.h"
                 hdr_file_path = os.path.join(output_dir, hdr_filename)
                 with open(hdr_file_path, 'w', encoding='utf-8') as f:
-                    for i in range(lb_hdr.count()):
-                        f.write(lb_hdr.item(i).text() + '\n')
+                    f.write(''.join(lb_hdr.item(i).text() + '\n' for i in range(lb_hdr.count())))
                 hdr_files.append(hdr_filename)
 
             if progress_dialog:
                 progress_callback(100, "코드 생성 완료")
 
-            result_message = f"코드 생성 완료: {len(src_files)}개 소스 파일, {len(hdr_files)}개 헤더 파일 (소요시간: {time.time() - start_time:.1f}초)"
+            result_message = f"코드 생성 완료: {len(src_files)}개 소스 파일, {len(hdr_files)}개 헤더 파일 (소요시간: {time.perf_counter() - start_time:.1f}초)"
 
             logging.info(f"MakeCode 코드 생성 완료: {result_message}")
 
@@ -3588,6 +3653,10 @@ class DBExcelEditor(QMainWindow):
             error_msg = f"실제 MakeCode 코드 생성 중 오류: {str(e)}"
             logging.error(f"{error_msg}\n{traceback.format_exc()}")
             return f"코드 생성 실패: {error_msg}"
+        finally:
+            # 호출자가 대화상자를 다음 DB에 재사용하므로 보류된 보고가 나중에 덮어쓰지 않도록 폐기
+            if progress_throttle:
+                progress_throttle.stop()
 
     def generate_code_for_single_db_copy(self, db_handler: 'DBHandlerV2', output_dir: str) -> str:
         """단일 DB 코드 생성 로직을 그대로 복사 (다중 DB용)"""
@@ -3756,13 +3825,11 @@ class DBExcelEditor(QMainWindow):
 
                     # 소스 파일 저장
                     with open(src_file_path, 'w', encoding='utf-8') as f_src:
-                        for i in range(lb_src.count()):
-                            f_src.write(lb_src.item(i).text() + '\n')
+                        f_src.write(''.join(lb_src.item(i).text() + '\n' for i in range(lb_src.count())))
 
                     # 헤더 파일 저장
                     with open(hdr_file_path, 'w', encoding='utf-8') as f_hdr:
-                        for i in range(lb_hdr.count()):
-                            f_hdr.write(lb_hdr.item(i).text() + '\n')
+                        f_hdr.write(''.join(lb_hdr.item(i).text() + '\n' for i in range(lb_hdr.count())))
 
                     result_message += f"✅ 그룹 '{group_name}' 코드 생성 완료: {src_filename}, {hdr_filename}\n\n"
 
@@ -3978,13 +4045,11 @@ class DBExcelEditor(QMainWindow):
 
                     # 소스 파일 저장
                     with open(src_file_path, 'w', encoding='utf-8') as f_src:
-                        for i in range(lb_src.count()):
-                            f_src.write(lb_src.item(i).text() + '\n')
+                        f_src.write(''.join(lb_src.item(i).text() + '\n' for i in range(lb_src.count())))
 
                     # 헤더 파일 저장
                     with open(hdr_file_path, 'w', encoding='utf-8') as f_hdr:
-                        for i in range(lb_hdr.count()):
-                            f_hdr.write(lb_hdr.item(i).text() + '\n')
+                        f_hdr.write(''.join(lb_hdr.item(i).text() + '\n' for i in range(lb_hdr.count())))
 
                     # 실제 파일 생성 확인
                     src_created = os.path.exists(src_file_path) and (not src_existed or os.path.getsize(src_file_path) > 0)
@@ -4271,13 +4336,11 @@ class DBExcelEditor(QMainWindow):
 
                     # 소스 파일 저장
                     with open(src_file_path, 'w', encoding='utf-8') as f_src:
-                        for i in range(lb_src.count()):
-                            f_src.write(lb_src.item(i).text() + '\n')
+                        f_src.write(''.join(lb_src.item(i).text() + '\n' for i in range(lb_src.count())))
 
                     # 헤더 파일 저장
                     with open(hdr_file_path, 'w', encoding='utf-8') as f_hdr:
-                        for i in range(lb_hdr.count()):
-                            f_hdr.write(lb_hdr.item(i).text() + '\n')
+                        f_hdr.write(''.join(lb_hdr.item(i).text() + '\n' for i in range(lb_hdr.count())))
 
                     logging.info(f"Code generated successfully for group '{group_name}': {src_filename}, {hdr_filename}")
 
@@ -4623,89 +4686,6 @@ class DBExcelEditor(QMainWindow):
         # 여기서는 특별한 작업 없이 종료 허용
         event.accept()
 
-    @Slot()
-    def cleanup(self):
-        """애플리케이션 종료 시 정리 작업 (다중 DB 상태 저장 및 DB 연결 해제)"""
-        logging.info("=== 애플리케이션 정리 작업 시작 ===")
-
-        try:
-            # 1. 개별 DB 핸들러 연결 해제 (안전 조치)
-            if hasattr(self, 'db') and self.db:
-                try:
-                    logging.info("개별 DB 핸들러 연결 해제 중...")
-                    self.db.disconnect()
-                    self.db = None
-                    logging.info("개별 DB 핸들러 연결 해제 완료")
-                except Exception as e:
-                    logging.error(f"개별 DB 핸들러 해제 오류: {e}")
-
-            # 2. DBManager를 통한 모든 DB 연결 해제
-            if hasattr(self, 'db_manager') and self.db_manager:
-                try:
-                    db_count = self.db_manager.get_database_count()
-                    logging.info(f"DBManager 정리 시작 - 현재 {db_count}개 DB 연결")
-
-
-
-                    # 모든 DB 연결 해제
-                    logging.info("모든 DB 연결 해제 중...")
-                    self.db_manager.disconnect_all()
-
-                    # 연결 해제 확인
-                    remaining_count = self.db_manager.get_database_count()
-                    if remaining_count == 0:
-                        logging.info("✅ 모든 DB 연결이 성공적으로 해제되었습니다.")
-                    else:
-                        logging.warning(f"⚠️ {remaining_count}개 DB 연결이 남아있습니다.")
-
-                    # DBManager 객체 정리
-                    self.db_manager = None
-
-                except Exception as e:
-                    logging.error(f"DBManager 정리 중 오류: {e}")
-
-            # 3. 기타 객체들 정리
-            cleanup_objects = [
-                ('importer', 'Excel 가져오기 객체'),
-                ('exporter', 'Excel 내보내기 객체'),
-                ('data_parser', '데이터 파서 객체'),
-                ('file_surrogate', '파일 대체 객체'),
-                ('original_surrogate', '원본 파일 대체 객체')
-            ]
-
-            for attr_name, description in cleanup_objects:
-                if hasattr(self, attr_name):
-                    try:
-                        obj = getattr(self, attr_name)
-                        if obj and hasattr(obj, 'disconnect'):
-                            obj.disconnect()
-                        setattr(self, attr_name, None)
-                        logging.debug(f"{description} 정리 완료")
-                    except Exception as e:
-                        logging.error(f"{description} 정리 중 오류: {e}")
-
-            # 4. 강제 가비지 컬렉션
-            import gc
-            gc.collect()
-            logging.info("가비지 컬렉션 실행 완료")
-
-        except Exception as e:
-            logging.error(f"정리 작업 중 예상치 못한 오류: {e}")
-            import traceback
-            logging.error(traceback.format_exc())
-
-        finally:
-            logging.info("=== 애플리케이션 정리 작업 완료 ===")
-
-            # 로그 핸들러도 정리 (선택사항)
-            try:
-                for handler in logging.getLogger().handlers[:]:
-                    handler.close()
-                    logging.getLogger().removeHandler(handler)
-            except:
-                pass  # 로그 정리 실패는 무시
-
-
     @Slot(int)
     def on_add_sheet(self, file_id: int):
         """
@@ -4859,7 +4839,7 @@ class DBExcelEditor(QMainWindow):
             QApplication.processEvents()
 
             # 현재 디렉토리의 모든 .db 파일 찾기
-            db_files = [f for f in os.listdir('.') if f.endswith('.db')]
+            db_files = self._find_local_db_files()
 
             # Git pull 및 백업 실행
             if self.history_manager.startup_routine(db_files):
@@ -4905,43 +4885,62 @@ class DBExcelEditor(QMainWindow):
             self.update_git_status("❌ Git 초기화 오류", "error")
             self.statusBar.showMessage("시작 루틴 오류 발생")
 
+    def _find_local_db_files(self) -> List[str]:
+        """
+        현재 디렉토리의 .db 파일 이름 목록 반환 (백업 대상 선정용)
+
+        os.scandir 단일 패스로 디렉토리 엔트리의 파일 타입 정보를 재사용하므로
+        파일별 추가 stat 호출 없이 일반 파일만 선별한다.
+        """
+        with os.scandir('.') as entries:
+            return [entry.name for entry in entries
+                    if entry.name.endswith('.db') and entry.is_file()]
+
+    @staticmethod
+    def _scan_dir_names(directory: str) -> Set[str]:
+        """
+        디렉토리의 엔트리 이름 집합 반환 (다중 변환 시 중복 파일명 검사용)
+
+        파일마다 os.path.exists로 stat을 호출하는 대신 os.scandir 한 번으로
+        이름 집합을 만들어 두고, 이후 중복 검사는 집합 조회로 처리한다.
+        이름은 os.path.normcase로 정규화해 저장 (Windows는 대소문자 구분 없음).
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            return set()
+
+    @staticmethod
+    def _make_unique_db_name(base_name: str, existing_names: Set[str]) -> str:
+        """
+        existing_names와 겹치지 않는 DB 파일명 생성 ({base}.db, {base}_1.db, ...)
+
+        비교는 os.path.normcase 기준이며, 선택된 이름은 existing_names에 바로 등록한다
+        (DB 파일은 핸들러 생성 시점에 만들어지므로 이후 중복 검사에 반영).
+        """
+        db_name = f"{base_name}.db"
+        counter = 1
+        while os.path.normcase(db_name) in existing_names:
+            db_name = f"{base_name}_{counter}.db"
+            counter += 1
+        existing_names.add(os.path.normcase(db_name))
+        return db_name
+
     def update_git_status(self, message: str, status_type: str = "info"):
         """Git 상태 레이블 업데이트"""
         if not hasattr(self, 'git_status_label'):
             return
 
-        # 상태별 스타일 설정
-        styles = {
-            "info": {
-                "background-color": "#e3f2fd",
-                "color": "#1976d2"
-            },
-            "success": {
-                "background-color": "#e8f5e8",
-                "color": "#2e7d32"
-            },
-            "error": {
-                "background-color": "#ffebee",
-                "color": "#c62828"
-            },
-            "warning": {
-                "background-color": "#fff3e0",
-                "color": "#ef6c00"
-            }
-        }
-
-        style = styles.get(status_type, styles["info"])
+        if status_type not in self.GIT_STATUS_STYLES:
+            status_type = "info"
 
         self.git_status_label.setText(message)
-        self.git_status_label.setStyleSheet(f"""
-            QLabel {{
-                padding: 3px 8px;
-                border-radius: 3px;
-                font-size: 11px;
-                background-color: {style["background-color"]};
-                color: {style["color"]};
-            }}
-        """)
+
+        # 상태 유형이 바뀐 경우에만 스타일시트 적용 (동일 스타일 재설정 시 발생하는 스타일 재계산 방지)
+        if getattr(self, '_git_status_style_type', None) != status_type:
+            self.git_status_label.setStyleSheet(self.GIT_STATUS_STYLES[status_type])
+            self._git_status_style_type = status_type
 
     def get_current_branch(self) -> str:
         """현재 Git 브랜치 이름 가져오기"""
@@ -5250,6 +5249,9 @@ class DBExcelEditor(QMainWindow):
                                   "Git 관리자가 초기화되지 않았습니다.")
                 return
 
+            # Git 상태 다이얼로그 모듈은 사용 시점에 로드 (앱 시작 시 import 비용 절감)
+            from ui.git_status_dialog import GitStatusDialog
+
             # Git 상태 다이얼로그 생성 및 표시 (DB 닫기 없이 바로)
             # DB 관리자 정보를 다이얼로그에 전달하여 커밋 시 DB 닫기 처리
             dialog = GitStatusDialog(self.git_manager, self, db_manager=self.db_manager)
@@ -5445,6 +5447,10 @@ class DBExcelEditor(QMainWindow):
 
             logging.info("=== 안전한 앱 시작 루틴 완료 ===")
 
+            # 시작 완료 메시지를 잠시 보여준 뒤 브랜치 표시로 복귀
+            # (.git 변경이 없으면 감시 기반 갱신이 일어나지 않으므로 직접 예약)
+            QTimer.singleShot(3000, self.update_git_status_display)
+
         except Exception as e:
             logging.error(f"안전한 앱 시작 루틴 중 오류: {e}")
             self.update_git_status("❌ 시작 오류", "error")
@@ -5480,7 +5486,7 @@ class DBExcelEditor(QMainWindow):
             QApplication.processEvents()
 
             # 현재 디렉토리의 모든 .db 파일 찾기
-            db_files = [f for f in os.listdir('.') if f.endswith('.db')]
+            db_files = self._find_local_db_files()
 
             # Git pull 및 백업 실행
             git_success = self.history_manager.startup_routine(db_files)
@@ -5519,6 +5525,9 @@ class DBExcelEditor(QMainWindow):
 
             logging.info("=== 완전한 시스템 새로고침 완료 ===")
 
+            # 완료 메시지를 잠시 보여준 뒤 브랜치 표시로 복귀
+            QTimer.singleShot(3000, self.update_git_status_display)
+
         except Exception as e:
             logging.error(f"완전한 시스템 새로고침 중 오류: {e}")
             self.update_git_status("❌ 시스템 초기화 오류", "error")
@@ -5610,8 +5619,16 @@ class DBExcelEditor(QMainWindow):
                 if current_db:
                     # 모든 참조 업데이트
                     self.db = current_db
-                    self.importer = ExcelImporter(current_db)
-                    self.exporter = ExcelExporter(current_db)
+                    # 가져오기/내보내기 객체는 DB 핸들러만 보유하므로 한 번 만든 뒤 재사용하고
+                    # DB가 바뀐 경우에만 핸들러를 다시 연결
+                    if self.importer is None:
+                        self.importer = ExcelImporter(current_db)
+                    elif self.importer.db is not current_db:
+                        self.importer.db = current_db
+                    if self.exporter is None:
+                        self.exporter = ExcelExporter(current_db)
+                    elif self.exporter.db is not current_db:
+                        self.exporter.db = current_db
                     self.grid_view.set_db_handler(current_db)
 
                     # 현재 DB 정보 로깅
@@ -5650,6 +5667,59 @@ class DBExcelEditor(QMainWindow):
         except Exception as e:
             logging.error(f"DB 참조 정리 중 오류: {e}")
 
+    def _get_git_watch_paths(self) -> List[str]:
+        """Git 상태 감시 대상 경로 (.git 디렉토리 및 HEAD 파일)"""
+        if self.git_manager:
+            git_root = self.git_manager.get_git_root()
+        else:
+            git_root = self.project_root
+
+        git_dir = os.path.join(git_root, '.git')
+        if not os.path.isdir(git_dir):
+            return []
+
+        watch_paths = [git_dir]
+        head_path = os.path.join(git_dir, 'HEAD')
+        if os.path.isfile(head_path):
+            watch_paths.append(head_path)
+        return watch_paths
+
+    def setup_git_watcher(self):
+        """Git 상태 변경 감시 설정 (실패 시 기존 3초 폴링으로 폴백)"""
+        try:
+            watch_paths = self._get_git_watch_paths()
+            if watch_paths:
+                failed_paths = self.git_watcher.addPaths(watch_paths)
+                if len(failed_paths) < len(watch_paths):
+                    logging.info(f"Git 상태 변경 감시 시작: {watch_paths}")
+                    # 감시는 변경 시에만 갱신하므로 현재 상태를 한 번 표시
+                    self.update_git_status_display()
+                    return
+            logging.warning("Git 디렉토리 감시 설정 실패 - 3초 주기 폴링으로 대체")
+        except Exception as e:
+            logging.warning(f"Git 디렉토리 감시 설정 중 오류: {e} - 3초 주기 폴링으로 대체")
+
+        self.git_status_timer = QTimer(self)
+        self.git_status_timer.timeout.connect(self.update_git_status_display)
+        self.git_status_timer.start(3000)  # 3초마다 업데이트
+
+    @Slot(str)
+    def schedule_git_status_update(self, path: str = ""):
+        """Git 파일 변경 알림 수신 - 디바운스 타이머 재시작"""
+        self.git_status_debounce_timer.start()
+
+    @Slot()
+    def on_git_state_changed(self):
+        """디바운스 후 Git 상태 갱신"""
+        # git은 HEAD를 lock 파일 교체(rename) 방식으로 갱신하므로 감시 목록에서 빠진 경우 재등록
+        watched_files = self.git_watcher.files()
+        for path in self.git_watcher.directories():
+            head_path = os.path.join(path, 'HEAD')
+            if head_path not in watched_files and os.path.isfile(head_path):
+                self.git_watcher.addPath(head_path)
+
+        self.update_git_status_display()
+
     def update_git_status_display(self):
         """Git 상태 표시 업데이트 (단순화된 버전)"""
         try:
@@ -158,40 +158,44 @@ class CommitFileDialog(QDialog):
 
     def populate_file_list(self):
         """파일 목록 채우기"""
-        for file_info in self.changed_files:
-            filename = file_info['filename']
-            change_type = file_info['change_type']
-            is_csv = file_info.get('is_csv', False)
-            is_db = file_info.get('is_db', False)
-            default_check = file_info.get('default_check', False)
-
-            # 리스트 아이템 생성
-            item = QListWidgetItem()
-            item.setText(f"{change_type}: {filename}")
-            item.setData(Qt.UserRole, file_info)
-
-            # 체크박스 설정
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-
-            # 기본 체크 설정 (CSV와 실제 DB 파일)
-            if default_check:
-                item.setCheckState(Qt.Checked)
-            else:
-                item.setCheckState(Qt.Unchecked)
-
-            # 아이콘 설정 (파일 타입별)
-            if is_csv:
-                item.setText(f"📊 {change_type}: {filename}")
-            elif is_db:
-                item.setText(f"🗄️ {change_type}: {filename}")
-            elif filename.endswith('.py'):
-                item.setText(f"🐍 {change_type}: {filename}")
-            elif filename.endswith('.log'):
-                item.setText(f"📋 {change_type}: {filename}")
-            else:
-                item.setText(f"📄 {change_type}: {filename}")
-
-            self.file_list.addItem(item)
+        # 항목을 모두 추가할 때까지 다시 그리기 중지
+        self.file_list.setUpdatesEnabled(False)
+        try:
+            for file_info in self.changed_files:
+                filename = file_info['filename']
+                change_type = file_info['change_type']
+                is_csv = file_info.get('is_csv', False)
+                is_db = file_info.get('is_db', False)
+                default_check = file_info.get('default_check', False)
+
+                # 아이콘 결정 (파일 타입별)
+                if is_csv:
+                    icon = "📊"
+                elif is_db:
+                    icon = "🗄️"
+                elif filename.endswith('.py'):
+                    icon = "🐍"
+                elif filename.endswith('.log'):
+                    icon = "📋"
+                else:
+                    icon = "📄"
+
+                # 리스트 아이템 생성 (표시 텍스트는 한 번만 설정)
+                item = QListWidgetItem(f"{icon} {change_type}: {filename}")
+                item.setData(Qt.UserRole, file_info)
+
+                # 체크박스 설정
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+
+                # 기본 체크 설정 (CSV와 실제 DB 파일)
+                if default_check:
+                    item.setCheckState(Qt.Checked)
+                else:
+                    item.setCheckState(Qt.Unchecked)
+
+                self.file_list.addItem(item)
+        finally:
+            self.file_list.setUpdatesEnabled(True)
 
     def on_file_selection_changed(self, item):
         """파일 선택 상태 변경 시"""
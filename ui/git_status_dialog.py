@@ -22,6 +22,49 @@ from PySide6.QtCore import Qt, QThread, QTimer, Signal
 from PySide6.QtGui import QFont, QTextCharFormat, QTextCursor, QColor
 
 
+# diff 뷰어용 텍스트 포맷 캐시 (QColor/QTextCharFormat를 파일 선택마다 새로 생성하지 않도록 최초 1회만 생성)
+_diff_formats = None
+
+
+def _get_diff_formats():
+    """diff 뷰어 라인 유형별 QTextCharFormat 반환 (최초 호출 시 생성 후 재사용)"""
+    global _diff_formats
+    if _diff_formats is None:
+        header_format = QTextCharFormat()
+        header_format.setForeground(QColor("#0056b3"))
+        header_format.setFontWeight(QFont.Bold)
+
+        chunk_header_format = QTextCharFormat()
+        chunk_header_format.setForeground(QColor("#6f42c1"))
+        chunk_header_format.setBackground(QColor("#f8f9fa"))
+        chunk_header_format.setFontWeight(QFont.Bold)
+
+        context_format = QTextCharFormat()
+        context_format.setForeground(QColor("#333"))
+
+        removed_format = QTextCharFormat()
+        removed_format.setForeground(QColor("#dc3545"))
+        removed_format.setBackground(QColor("#f8d7da"))
+
+        added_format = QTextCharFormat()
+        added_format.setForeground(QColor("#28a745"))
+        added_format.setBackground(QColor("#d4edda"))
+
+        empty_format = QTextCharFormat()
+        empty_format.setForeground(QColor("#e9ecef"))
+        empty_format.setBackground(QColor("#f8f9fa"))
+
+        _diff_formats = {
+            'header': header_format,
+            'chunk_header': chunk_header_format,
+            'context': context_format,
+            'removed': removed_format,
+            'added': added_format,
+            'empty': empty_format,
+        }
+    return _diff_formats
+
+
 class GitStatusDialog(QDialog):
     """Git 상태 확인 및 커밋 다이얼로그"""
 
@@ -429,8 +472,9 @@ class GitStatusDialog(QDialog):
                 except Exception as e:
                     logging.debug(f"신호 해제 중 예외 (무시됨): {e}")
 
-            # 신호 차단하고 목록 초기화
+            # 신호 차단하고 목록 초기화 (항목 추가가 끝날 때까지 다시 그리기도 중지)
             self.file_list.blockSignals(True)
+            self.file_list.setUpdatesEnabled(False)
             self.file_list.clear()
             self.selected_files.clear()
 
@@ -457,7 +501,8 @@ class GitStatusDialog(QDialog):
 
                 self.file_list.addItem(item)
 
-            # 신호 차단 해제
+            # 다시 그리기/신호 차단 해제
+            self.file_list.setUpdatesEnabled(True)
             self.file_list.blockSignals(False)
 
             # 이벤트 연결 (한 번만)
@@ -469,6 +514,8 @@ class GitStatusDialog(QDialog):
             logging.info(f"파일 목록 업데이트 완료: {len(self.selected_files)}개 기본 선택됨")
 
         except Exception as e:
+            # 목록이 다시 그려지지 않는 상태로 남지 않도록 복구
+            self.file_list.setUpdatesEnabled(True)
             logging.error(f"파일 목록 업데이트 중 오류: {e}")
             import traceback
             logging.error(traceback.format_exc())
@@ -811,30 +858,14 @@ class GitStatusDialog(QDialog):
         """diff 뷰어에 라인들을 채우기 (개선된 포맷팅)"""
         cursor = viewer.textCursor()
 
-        # 포맷 설정
-        header_format = QTextCharFormat()
-        header_format.setForeground(QColor("#0056b3"))
-        header_format.setFontWeight(QFont.Bold)
-
-        chunk_header_format = QTextCharFormat()
-        chunk_header_format.setForeground(QColor("#6f42c1"))
-        chunk_header_format.setBackground(QColor("#f8f9fa"))
-        chunk_header_format.setFontWeight(QFont.Bold)
-
-        context_format = QTextCharFormat()
-        context_format.setForeground(QColor("#333"))
-
-        removed_format = QTextCharFormat()
-        removed_format.setForeground(QColor("#dc3545"))
-        removed_format.setBackground(QColor("#f8d7da"))
-
-        added_format = QTextCharFormat()
-        added_format.setForeground(QColor("#28a745"))
-        added_format.setBackground(QColor("#d4edda"))
-
-        empty_format = QTextCharFormat()
-        empty_format.setForeground(QColor("#e9ecef"))
-        empty_format.setBackground(QColor("#f8f9fa"))
+        # 포맷 설정 (모듈 수준 캐시 재사용)
+        formats = _get_diff_formats()
+        header_format = formats['header']
+        chunk_header_format = formats['chunk_header']
+        context_format = formats['context']
+        removed_format = formats['removed']
+        added_format = formats['added']
+        empty_format = formats['empty']
 
         for line_type, content in lines:
             if line_type == 'header':
@@ -1193,14 +1224,18 @@ class GitStatusDialog(QDialog):
             # 새로운 Git 상태 가져오기
             self.files_after_db_close = self.git_manager.get_changed_files(use_enhanced_encoding=True)
 
-            # 새로 생긴 파일들 찾기
+            # 새로 생긴 파일들 찾기 (파일명 인덱스/집합을 한 번만 만들어 파일마다 목록 재탐색 방지)
             files_after_names = [f['filename'] for f in self.files_after_db_close]
+            files_after_by_name = {}
+            for f in self.files_after_db_close:
+                files_after_by_name.setdefault(f['filename'], f)  # 같은 파일명은 첫 항목 사용
+            files_before_names = set(self.files_before_db_close)
             self.new_files_from_db_close = []
 
             for filename in files_after_names:
-                if filename not in self.files_before_db_close:
+                if filename not in files_before_names:
                     # 새로 생긴 파일 찾기
-                    file_info = next((f for f in self.files_after_db_close if f['filename'] == filename), None)
+                    file_info = files_after_by_name.get(filename)
                     if file_info:
                         self.new_files_from_db_close.append(file_info)
 
@@ -1209,9 +1244,11 @@ class GitStatusDialog(QDialog):
                 logging.info(f"  - 새 파일: {new_file['filename']} ({new_file['change_type']})")
 
             # 새로 생긴 파일들을 선택된 파일 목록에 자동 추가
+            selected_names = set(self.selected_files)
             for new_file in self.new_files_from_db_close:
-                if new_file['filename'] not in self.selected_files:
+                if new_file['filename'] not in selected_names:
                     self.selected_files.append(new_file['filename'])
+                    selected_names.add(new_file['filename'])
 
             # 전체 변경된 파일 목록 업데이트
             self.changed_files = self.files_after_db_close
@@ -1341,8 +1378,8 @@ class GitStatusDialog(QDialog):
                     file_list_layout.addWidget(file_item)
 
         # 기존 파일들
-        existing_selected_files = [f for f in self.selected_files
-                                 if f not in [nf['filename'] for nf in self.new_files_from_db_close]]
+        new_file_names = {nf['filename'] for nf in self.new_files_from_db_close}
+        existing_selected_files = [f for f in self.selected_files if f not in new_file_names]
 
         if existing_selected_files:
             # 섹션 헤더
@@ -1359,9 +1396,13 @@ class GitStatusDialog(QDialog):
             """)
             file_list_layout.addWidget(existing_header)
 
-            # 파일 목록
+            # 파일 목록 (파일명 -> 파일 정보 인덱스, 같은 파일명은 첫 항목 사용)
+            changed_by_name = {}
+            for f in self.changed_files:
+                changed_by_name.setdefault(f['filename'], f)
+
             for filename in existing_selected_files:
-                file_info = next((f for f in self.changed_files if f['filename'] == filename), None)
+                file_info = changed_by_name.get(filename)
                 if file_info:
                     file_item = QLabel(f"{file_info['change_type']} • {filename}")
                     file_item.setStyleSheet("""
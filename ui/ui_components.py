@@ -16,6 +16,9 @@ from PySide6.QtWidgets import (
     QStyle, QApplication
 )
 
+# 클립보드 텍스트용 셀 정리 테이블 (줄바꿈/탭 -> 공백, 한 번의 translate로 처리)
+_CLIPBOARD_CELL_TABLE = str.maketrans('\n\t', '  ')
+
 class FastItemDelegate(QStyledItemDelegate):
     """빠른 렌더링을 위한 아이템 델리게이트"""
 
@@ -69,8 +72,9 @@ class FastItemDelegate(QStyledItemDelegate):
 
         # 캐시된 크기가 있으면 사용
         cache_key = str(text)
-        if cache_key in self.size_cache:
-            return self.size_cache[cache_key]
+        cached_size = self.size_cache.get(cache_key)
+        if cached_size is not None:
+            return cached_size
 
         # 텍스트 크기 계산
         fm = QFontMetrics(option.font)
@@ -278,12 +282,13 @@ class VirtualizedGridModel(QAbstractTableModel):
         # 캐시 크기 관리 (오래된 행 제거 - 수정되지 않은 행만)
         if len(self.cache) >= self.cache_size:
             rows_to_remove = []
+            # 수정된 셀이 있는 행 번호 집합 (행별 셀 단위 검사 대신 집합 조회 1회)
+            modified_rows = {r for r, _ in self.modified_cells}
             # 현재 행에서 멀리 떨어진, 수정되지 않은 행 찾기
             sorted_rows = sorted(self.cache.keys(), key=lambda r: abs(r - row))
             removed_count = 0
             for r in reversed(sorted_rows): # 가장 먼 행부터 확인
-                is_modified = any((r, c) in self.modified_cells for c in self.cache[r])
-                if not is_modified:
+                if r not in modified_rows:
                     rows_to_remove.append(r)
                     removed_count += 1
                     if removed_count >= 100: # 최대 100개 제거
@@ -292,10 +297,10 @@ class VirtualizedGridModel(QAbstractTableModel):
             for r in rows_to_remove:
                 del self.cache[r]
             if rows_to_remove:
-                logging.debug(f"Removed {len(rows_to_remove)} rows from cache.")
+                logging.debug("Removed %d rows from cache.", len(rows_to_remove))
 
         # DB에서 행 데이터 로드
-        logging.debug(f"Loading row {row} from DB for sheet {self.sheet_id}")
+        logging.debug("Loading row %d from DB for sheet %s", row, self.sheet_id)
         row_data = self.db.get_row_data(self.sheet_id, row)
         self.cache[row] = row_data
 
@@ -787,92 +792,6 @@ class ExcelGridView(QTableView):
 
         logging.debug(f"열 선택 단축키: {len(selected_columns)}개 열 전체 선택됨")
 
-    def handle_delete_columns(self):
-        """단축키로 열 삭제 처리"""
-        if self._is_deleting:
-            return
-
-        self._is_deleting = True
-        try:
-            logging.debug("열 삭제 단축키 (Ctrl+D) 감지됨")
-
-            # 열이 선택되었는지 확인
-            if self.is_full_column_selected():
-                self.delete_selected_columns()
-            else:
-                # 현재 선택된 셀의 열만 삭제
-                current_index = self.currentIndex()
-                if current_index.isValid():
-                    col = current_index.column()
-                    col_name = self.model.headerData(col, Qt.Horizontal, Qt.DisplayRole)
-
-                    reply = QMessageBox.question(
-                        self, '열 삭제 확인',
-                        f"'{col_name}' 열을 삭제하시겠습니까?",
-                        QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-                    )
-
-                    if reply == QMessageBox.Yes:
-                        logging.debug(f"열 {col} 삭제 시도")
-                        self.model.removeColumns(col, 1)
-        finally:
-            self._is_deleting = False
-
-    def handle_delete_rows(self):
-        """단축키로 행 삭제 처리"""
-        if self._is_deleting:
-            return
-
-        self._is_deleting = True
-        try:
-            logging.debug("행 삭제 단축키 (Ctrl+R) 감지됨")
-
-            # 행이 선택되었는지 확인
-            if self.is_full_row_selected():
-                self.delete_selected_rows()
-            else:
-                # 현재 선택된 셀의 행만 삭제
-                current_index = self.currentIndex()
-                if current_index.isValid():
-                    row = current_index.row()
-                    row_name = str(row + 1)  # 1부터 시작하는 행 번호
-
-                    reply = QMessageBox.question(
-                        self, '행 삭제 확인',
-                        f"{row_name}행을 삭제하시겠습니까?",
-                        QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-                    )
-
-                    if reply == QMessageBox.Yes:
-                        logging.debug(f"행 {row} 삭제 시도")
-                        self.model.removeRows(row, 1)
-        finally:
-            self._is_deleting = False
-
-    def handle_delete_columns(self):
-        """단축키로 열 삭제 처리"""
-        logging.debug("열 삭제 단축키 감지됨")
-
-        # 열이 선택되었는지 확인
-        if self.is_full_column_selected():
-            self.delete_selected_columns()
-        else:
-            # 현재 선택된 셀의 열만 삭제
-            current_index = self.currentIndex()
-            if current_index.isValid():
-                col = current_index.column()
-                col_name = self.model.headerData(col, Qt.Horizontal, Qt.DisplayRole)
-
-                reply = QMessageBox.question(
-                    self, '열 삭제 확인',
-                    f"'{col_name}' 열을 삭제하시겠습니까?",
-                    QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-                )
-
-                if reply == QMessageBox.Yes:
-                    logging.debug(f"열 {col} 삭제 시도")
-                    self.model.removeColumns(col, 1)
-
     def set_db_handler(self, db_handler):
         """
         DB 핸들러 설정 및 모델 생성/연결
@@ -887,30 +806,6 @@ class ExcelGridView(QTableView):
         # 모델의 data_changed 시그널은 필요시 연결 (예: 실시간 협업)
         # self.model.data_changed.connect(self.on_data_changed)
 
-    def load_sheet(self, sheet_id):
-        """
-        시트 로드 - 모델에 위임
-
-        Args:
-            sheet_id: 로드할 시트 ID
-        """
-        if not self.model:
-            logging.warning("Cannot load sheet: Model not set.")
-            return
-        try:
-            self.model.load_sheet(sheet_id)
-            # 로드 후 첫 번째 셀 선택 (선택사항)
-            self.clearSelection()
-            self.setCurrentIndex(self.model.index(0, 0))
-
-            # 뷰포트를 강제로 다시 그리도록 요청하여 검은 화면 버그 수정
-            self.viewport().update()
-
-            logging.info(f"Sheet {sheet_id} loaded and view updated.")
-        except Exception as e:
-            logging.error(f"Error loading sheet {sheet_id} in view: {e}")
-            QMessageBox.critical(self, "오류", f"시트 로드 중 오류 발생: {str(e)}")
-
     def save_changes(self):
         """변경 사항 저장 - 모델에 위임"""
         if self.model:
@@ -1477,7 +1372,7 @@ class ExcelGridView(QTableView):
                 # 모델에서 직접 데이터 가져오기 (표시된 값)
                 value = self.model.data(model_index, Qt.DisplayRole) or ""
                 row_data.append(value)
-                row_text_parts.append(value.replace('\n', ' ').replace('\t', ' ')) # 클립보드용 텍스트 처리
+                row_text_parts.append(value.translate(_CLIPBOARD_CELL_TABLE)) # 클립보드용 텍스트 처리
             copied_data.append(row_data)
             clipboard_text += "\t".join(row_text_parts) + "\n"
 
@@ -1777,7 +1672,7 @@ class TreeViewModel(QStandardItemModel):
         self.clear()
         self.setHorizontalHeaderLabels(["이름"])
 
-        root_item = self.invisibleRootItem()
+        file_items = []
         for file_info in files:
             # 파일 항목 생성
             file_item = QStandardItem(file_info['name'])
@@ -1785,12 +1680,16 @@ class TreeViewModel(QStandardItemModel):
             file_item.setData("file", Qt.UserRole + 1)  # 항목 유형 저장
             file_item.setEditable(True) # 이름 수정 가능하도록 설정
 
-            # 모델에 파일 항목 추가
-            root_item.appendRow(file_item)
+            # 파일에 속한 시트가 이미 로드되어 있으면 추가 (모델에 붙이기 전이라 행 삽입 시그널 없음)
+            sheets = self.sheets_by_file.get(file_info['id'])
+            if sheets is not None:
+                self._add_sheet_items(file_item, sheets)
+
+            file_items.append(file_item)
 
-            # 파일에 속한 시트가 이미 로드되어 있으면 추가
-            if file_info['id'] in self.sheets_by_file:
-                self._add_sheet_items(file_item, self.sheets_by_file[file_info['id']])
+        # 모델에 파일 항목 일괄 추가 (행마다 삽입 시그널이 발생하지 않도록)
+        if file_items:
+            self.invisibleRootItem().appendRows(file_items)
 
     def update_sheets(self, file_id: int, sheets: List[Dict[str, Any]]):
         """
@@ -1811,20 +1710,13 @@ class TreeViewModel(QStandardItemModel):
                 item.removeRows(0, item.rowCount())
 
                 # 시트 항목 추가
-                for sheet in sheets:
-                    # 시트 항목 생성
-                    sheet_item = QStandardItem(sheet['name'])
-                    sheet_item.setData(sheet['id'], Qt.UserRole)  # ID 저장
-                    sheet_item.setData("sheet", Qt.UserRole + 1)  # 항목 유형 저장
-                    sheet_item.setData(sheet.get('is_dollar_sheet', False), Qt.UserRole + 2)
-
-                    # 파일 항목에 시트 항목 추가
-                    item.appendRow(sheet_item)
+                self._add_sheet_items(item, sheets)
 
                 break
 
     def _add_sheet_items(self, file_item: QStandardItem, sheets: List[Dict[str, Any]]):
         """파일 아이템 아래에 시트 아이템들을 추가하는 도우미 메서드"""
+        sheet_items = []
         for sheet_info in sheets:
             # 시트 항목 생성
             sheet_item = QStandardItem(sheet_info['name'])
@@ -1832,9 +1724,11 @@ class TreeViewModel(QStandardItemModel):
             sheet_item.setData("sheet", Qt.UserRole + 1)  # 항목 유형 저장
             sheet_item.setData(sheet_info.get('is_dollar_sheet', False), Qt.UserRole + 2) # 달러 시트 여부
             sheet_item.setEditable(True) # 이름 수정 가능하도록 설정
+            sheet_items.append(sheet_item)
 
-            # 파일 항목에 시트 항목 추가
-            file_item.appendRow(sheet_item)
+        # 파일 항목에 시트 항목 일괄 추가
+        if sheet_items:
+            file_item.appendRows(sheet_items)
 
     def get_sheets(self, file_id: int) -> List[Dict[str, Any]]:
         """
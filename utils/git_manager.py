@@ -15,6 +15,20 @@ from datetime import datetime
 from typing import Dict, List
 from pathlib import Path
 
+# Git status 파싱/파일명 복구용 정규식 (파일마다 호출되므로 모듈 로드 시 1회만 컴파일)
+_STATUS_LINE_PATTERN = re.compile(r'^(.{2})[\s\t](.+)$')
+_HANGUL_OCTAL_ESCAPE_PATTERN = re.compile(r'/3[0-7][0-7]/[0-7][0-7][0-7]/[0-7][0-7][0-7]')  # 한글
+_OTHER_OCTAL_ESCAPE_PATTERN = re.compile(r'/2[0-7][0-7]/[0-7][0-7][0-7]/[0-7][0-7][0-7]')  # 기타 문자
+
+# Git status 상태 코드 접두사 -> 변경 유형 (첫 글자로 먼저 조회, '??'는 두 글자로 조회)
+_STATUS_CHANGE_TYPES = {
+    'A': "추가됨",
+    'D': "삭제됨",
+    'M': "수정됨",
+    'R': "이름변경",
+    '??': "추가됨",
+}
+
 
 class GitManager:
     """Git 연동 관리 클래스"""
@@ -34,6 +48,11 @@ class GitManager:
         # backup 디렉토리는 실제 백업 시에만 생성
         self.history_dir.mkdir(exist_ok=True)
 
+        # 셀 편집마다 호출되는 상태 표시용 조회 결과 캐시 (git 하위 프로세스 실행 생략)
+        self._git_root_cache: Dict[str, str] = {}  # 작업 디렉토리 -> Git 루트
+        self._branch_cache_key = None  # (Git 루트, HEAD 지문)
+        self._branch_cache_value = ""
+
         logging.info(f"GitManager 초기화 (로컬 Git 전용): {self.project_root}")
         logging.info(f"Git 실행 파일: {self.git_executable}")
 
@@ -601,6 +620,11 @@ class GitManager:
             # 현재 디렉토리에서 시작해서 Git 루트 찾기
             current_dir = os.getcwd()
 
+            # 같은 작업 디렉토리에서는 이전에 찾은 루트 재사용
+            cached_root = self._git_root_cache.get(current_dir)
+            if cached_root is not None:
+                return cached_root
+
             # 인코딩 문제 해결을 위한 환경변수 설정
             env = os.environ.copy()
             env['PYTHONIOENCODING'] = 'utf-8'
@@ -621,6 +645,7 @@ class GitManager:
             # Windows 경로 정규화 (슬래시 통일)
             git_root = git_root.replace('\\', '/')
             logging.info(f"Git 루트 찾음: {git_root} (현재 디렉토리: {current_dir})")
+            self._git_root_cache[current_dir] = git_root
             return git_root
         except Exception as e:
             # Git 루트를 찾을 수 없으면 현재 디렉토리 사용
@@ -628,11 +653,25 @@ class GitManager:
             logging.warning(f"Git 루트 찾기 실패: {e}, 현재 디렉토리 사용: {current_dir}")
             return current_dir
 
+    def _get_head_fingerprint(self, git_root: str):
+        """HEAD 파일 지문 (수정 시각, 크기) - 브랜치 전환 감지용, 확인 불가 시 None"""
+        try:
+            head_stat = os.stat(os.path.join(git_root, '.git', 'HEAD'))
+            return (head_stat.st_mtime_ns, head_stat.st_size)
+        except OSError:
+            return None
+
     def get_current_branch(self) -> str:
         """현재 브랜치 가져오기"""
         try:
             git_root = self.get_git_root()
 
+            # HEAD가 바뀌지 않았으면 이전 결과 재사용 (브랜치 전환 시 HEAD 파일이 다시 쓰여짐)
+            head_fingerprint = self._get_head_fingerprint(git_root)
+            cache_key = (git_root, head_fingerprint)
+            if head_fingerprint is not None and self._branch_cache_key == cache_key:
+                return self._branch_cache_value
+
             # 인코딩 문제 해결을 위한 환경변수 설정
             env = os.environ.copy()
             env['PYTHONIOENCODING'] = 'utf-8'
@@ -648,7 +687,12 @@ class GitManager:
                                   env=env,
                                   timeout=10,
                                   check=True)
-            return result.stdout.strip() or "detached HEAD"
+            branch_name = result.stdout.strip() or "detached HEAD"
+
+            if head_fingerprint is not None:
+                self._branch_cache_key = cache_key
+                self._branch_cache_value = branch_name
+            return branch_name
         except Exception as e:
             logging.warning(f"현재 브랜치 가져오기 실패: {e}")
             return "알 수 없음"
@@ -789,6 +833,14 @@ class GitManager:
             lines = result.stdout.strip().split('\n')
             logging.info(f"Git status 파싱: {len(lines)}개 라인")
 
+            # history 디렉토리 최신 CSV 탐색 결과 캐시 (라인마다 rglob + 정렬 반복 방지)
+            latest_history_csv = None
+            latest_history_csv_searched = False
+
+            # 경로 정규화용 현재 디렉토리 이름/접두사는 파일마다 다시 구하지 않고 한 번만 계산
+            current_dir_name = Path.cwd().name
+            current_dir_prefix = f"{current_dir_name}/"
+
             for line_num, line in enumerate(lines, 1):
                 if not line.strip():
                     continue
@@ -806,7 +858,7 @@ class GitManager:
 
                 # Git status 형식: XY filename (X, Y는 상태 문자, 그 다음 공백 또는 탭, 그 다음 파일명)
                 # 정규표현식 패턴: 처음 2문자(상태) + 공백/탭 + 나머지(파일명)
-                match = re.match(r'^(.{2})[\s\t](.+)$', line)
+                match = _STATUS_LINE_PATTERN.match(line)
                 if match:
                     status = match.group(1)
                     filename = match.group(2)
@@ -848,15 +900,17 @@ class GitManager:
                         git_root_path = Path(git_root)
                         if filename.endswith('.csv') and 'history' in filename:
                             # history 디렉토리의 최근 CSV 파일들로 대체
-                            history_dir = git_root_path / 'history'
-                            if history_dir.exists():
-                                recent_csvs = sorted(history_dir.rglob('*.csv'),
-                                                   key=lambda f: f.stat().st_mtime, reverse=True)
-                                if recent_csvs:
-                                    # 가장 최근 파일로 대체 (임시)
-                                    corrected = recent_csvs[0].relative_to(git_root_path)
-                                    filename = str(corrected).replace('\\', '/')
-                                    logging.info(f"   🔧 인코딩 문제 파일 대체: -> '{filename}'")
+                            if not latest_history_csv_searched:
+                                latest_history_csv_searched = True
+                                history_dir = git_root_path / 'history'
+                                if history_dir.exists():
+                                    latest_history_csv = max(history_dir.rglob('*.csv'),
+                                                             key=lambda f: f.stat().st_mtime, default=None)
+                            if latest_history_csv is not None:
+                                # 가장 최근 파일로 대체 (임시)
+                                corrected = latest_history_csv.relative_to(git_root_path)
+                                filename = str(corrected).replace('\\', '/')
+                                logging.info(f"   🔧 인코딩 문제 파일 대체: -> '{filename}'")
                     except Exception as fix_error:
                         logging.debug(f"인코딩 문제 파일 수정 실패: {fix_error}")
 
@@ -878,27 +932,17 @@ class GitManager:
                 filename = filename.strip('"\'')
 
                 # 알려진 경로 패턴 수정
-                filename = self._fix_known_path_issues(filename)
+                filename = self._fix_known_path_issues(filename, current_dir_name)
 
                 # Git status에서 반환된 경로 정규화 (중복 제거)
-                current_dir_name = Path.cwd().name
-                if filename.startswith(f"{current_dir_name}/"):
+                if filename.startswith(current_dir_prefix):
                     original_filename = filename
-                    filename = filename[len(current_dir_name)+1:]
+                    filename = filename[len(current_dir_prefix):]
                     logging.debug(f"Git status 경로 정규화: '{original_filename}' -> '{filename}'")
 
-                # 상태 해석
-                change_type = "수정됨"
-                if status.startswith('A'):
-                    change_type = "추가됨"
-                elif status.startswith('D'):
-                    change_type = "삭제됨"
-                elif status.startswith('M'):
-                    change_type = "수정됨"
-                elif status.startswith('R'):
-                    change_type = "이름변경"
-                elif status.startswith('??'):
-                    change_type = "추가됨"
+                # 상태 해석 (접두사 분기 대신 딕셔너리 조회)
+                change_type = (_STATUS_CHANGE_TYPES.get(status[:1])
+                               or _STATUS_CHANGE_TYPES.get(status[:2], "수정됨"))
 
                 # 파일 타입 분류
                 is_csv = filename.endswith('.csv')
@@ -933,8 +977,13 @@ class GitManager:
             logging.error(f"변경된 파일 목록 가져오기 실패: {e}")
             return []
 
-    def _fix_known_path_issues(self, filename: str) -> str:
-        """알려진 경로 문제 수정 (유니코드 이스케이프 디코딩)"""
+    def _fix_known_path_issues(self, filename: str, current_dir_name: str = None) -> str:
+        """알려진 경로 문제 수정 (유니코드 이스케이프 디코딩)
+
+        Args:
+            filename: 수정할 파일 경로
+            current_dir_name: 현재 디렉토리 이름 (반복 호출 시 호출자가 미리 계산해 전달)
+        """
         try:
             # 유니코드 이스케이프 시퀀스 디코딩
             if '/3' in filename:  # 한글 유니코드 범위
@@ -944,7 +993,8 @@ class GitManager:
                     filename = decoded_filename
 
             # 동적 경로 수정 - 현재 디렉토리 이름 기반
-            current_dir_name = Path.cwd().name
+            if current_dir_name is None:
+                current_dir_name = Path.cwd().name
 
             # 0이 빠진 디렉토리 이름 패턴 수정 (예: 7_Python_DB_Refactoring -> 07_Python_DB_Refactoring)
             if current_dir_name.startswith('0') and len(current_dir_name) > 1:
@@ -964,8 +1014,6 @@ class GitManager:
     def _decode_unicode_escape_path(self, path: str) -> str:
         """유니코드 이스케이프 시퀀스가 포함된 경로 디코딩"""
         try:
-            import re
-
             # /숫자/숫자/숫자 패턴을 찾아서 유니코드 문자로 변환
             def replace_unicode_escape(match):
                 try:
@@ -982,17 +1030,16 @@ class GitManager:
                 return match.group(0)
 
             # /숫자/숫자/숫자 패턴 찾기 (한글 유니코드 범위)
-            pattern = r'/3[0-7][0-7]/[0-7][0-7][0-7]/[0-7][0-7][0-7]'
-            decoded_path = re.sub(pattern, replace_unicode_escape, path)
+            decoded_path = _HANGUL_OCTAL_ESCAPE_PATTERN.sub(replace_unicode_escape, path)
 
             # 추가 패턴들도 처리
             patterns = [
-                r'/3[0-7][0-7]/[0-7][0-7][0-7]/[0-7][0-7][0-7]',  # 한글
-                r'/2[0-7][0-7]/[0-7][0-7][0-7]/[0-7][0-7][0-7]',  # 기타 문자
+                _HANGUL_OCTAL_ESCAPE_PATTERN,  # 한글
+                _OTHER_OCTAL_ESCAPE_PATTERN,   # 기타 문자
             ]
 
             for pattern in patterns:
-                decoded_path = re.sub(pattern, replace_unicode_escape, decoded_path)
+                decoded_path = pattern.sub(replace_unicode_escape, decoded_path)
 
             return decoded_path
 
@@ -1061,9 +1108,8 @@ class GitManager:
         """손상된 파일명인지 확인 (수정된 버전)"""
         try:
             # 1. 유니코드 이스케이프 시퀀스 패턴만 감지 (더 정확한 패턴)
-            import re
             # /354/240/204 같은 연속된 8진수 패턴만 감지
-            if re.search(r'/3[0-7][0-7]/[0-7][0-7][0-7]/[0-7][0-7][0-7]', filename):
+            if _HANGUL_OCTAL_ESCAPE_PATTERN.search(filename):
                 logging.debug(f"유니코드 이스케이프 패턴 감지: {filename[:50]}...")
                 return True
 
@@ -1430,10 +1476,11 @@ class GitManager:
             current_cwd = Path.cwd()
             git_execution_dir = current_cwd  # 기본값
 
-            # 실제 파일 위치를 확인하여 Git 실행 디렉토리 결정
-            for filename in selected_files:
-                normalized_filename = self._normalize_git_path(filename, current_cwd)
+            # 정규화된 경로는 실행 디렉토리 결정과 무시 파일 필터링에서 함께 쓰므로 파일마다 한 번만 계산
+            normalized_files = [self._normalize_git_path(filename, current_cwd) for filename in selected_files]
 
+            # 실제 파일 위치를 확인하여 Git 실행 디렉토리 결정
+            for normalized_filename in normalized_files:
                 # 현재 디렉토리에서 파일 확인
                 current_path = current_cwd / normalized_filename
                 parent_path = current_cwd.parent / normalized_filename
@@ -1456,11 +1503,8 @@ class GitManager:
 
             # 선택된 파일들 중 .gitignore에 의해 무시되지 않는 파일만 필터링
             valid_files = []
-            for filename in selected_files:
+            for filename, normalized_filename in zip(selected_files, normalized_files):
                 try:
-                    # 경로 정규화
-                    normalized_filename = self._normalize_git_path(filename, current_cwd)
-
                     # .gitignore에 의해 무시되는 파일인지 확인
                     if self._is_file_ignored(normalized_filename, git_execution_dir):
                         logging.warning(f"⚠️ 무시된 파일 스킵: {normalized_filename}")